@@ -0,0 +1,364 @@
+import heapq
+import math
+from collections import deque
+from collections.abc import Callable, Collection, Iterable, Iterator
+from itertools import count
+from typing import Generic, Optional, Protocol, TypeVar
+
+T = TypeVar('T')
+
+
+class Adyacencia(Protocol[T]):
+  """Protocolo de solo lectura que cumplen GrafoAdyacencia, MatrizAdyacencia y grafo_simple.Grafo."""
+  @property
+  def nodos(self) -> Collection[T]: ...
+  def vecinos_de(self, nodo: T) -> Iterable[T]: ...
+
+
+class AdyacenciaPonderada(Adyacencia[T], Protocol[T]):
+  """Adyacencia con pesos: las tres representaciones de grafo lo cumplen (las aristas pesan 1 por defecto)."""
+  def vecinos_con_peso(self, nodo: T) -> Iterable[tuple[T, float]]: ...
+
+
+def _validar_nodo(grafo: Adyacencia[T], nodo: T) -> None:
+  if nodo not in grafo.nodos:
+    raise ValueError("No existe el nodo origen en el grafo")
+
+
+# Todos los recorridos son iterativos (cola o pila explícita) y cuestan O(V + E)
+def bfs(grafo: Adyacencia[T], origen: T) -> Iterator[T]:
+  _validar_nodo(grafo, origen)
+  visitados = {origen}
+  cola = deque([origen])
+  while cola:
+    nodo = cola.popleft()
+    yield nodo
+    for vecino in grafo.vecinos_de(nodo):
+      if vecino not in visitados:
+        visitados.add(vecino)
+        cola.append(vecino)
+
+
+def dfs(grafo: Adyacencia[T], origen: T) -> Iterator[T]:
+  # Pila de iteradores de vecinos: visita en el mismo orden que la versión recursiva
+  _validar_nodo(grafo, origen)
+  visitados = {origen}
+  yield origen
+  pila = [iter(grafo.vecinos_de(origen))]
+  while pila:
+    for vecino in pila[-1]:
+      if vecino not in visitados:
+        visitados.add(vecino)
+        yield vecino
+        pila.append(iter(grafo.vecinos_de(vecino)))
+        break
+    else:
+      pila.pop()
+
+
+def componentes_conexas(grafo: Adyacencia[T]) -> list[set[T]]:
+  componentes: list[set[T]] = []
+  visitados: set[T] = set()
+  for nodo in grafo.nodos:
+    if nodo not in visitados:
+      componente = set(bfs(grafo, nodo))
+      visitados |= componente
+      componentes.append(componente)
+  return componentes
+
+
+def _bfs_arbol(grafo: Adyacencia[T], origen: T, destino: Optional[T] = None) -> tuple[dict[T, int], dict[T, Optional[T]]]:
+  # Distancias (en aristas) y predecesores desde origen; corta al llegar a destino si se indica
+  _validar_nodo(grafo, origen)
+  distancias = {origen: 0}
+  predecesores: dict[T, Optional[T]] = {origen: None}
+  cola = deque([origen])
+  while cola:
+    nodo = cola.popleft()
+    if nodo == destino:
+      break
+    for vecino in grafo.vecinos_de(nodo):
+      if vecino not in distancias:
+        distancias[vecino] = distancias[nodo] + 1
+        predecesores[vecino] = nodo
+        cola.append(vecino)
+  return distancias, predecesores
+
+
+def distancias(grafo: Adyacencia[T], origen: T) -> dict[T, int]:
+  """Cantidad mínima de aristas desde origen a cada nodo alcanzable."""
+  return _bfs_arbol(grafo, origen)[0]
+
+
+def distancias_todos(grafo: Adyacencia[T]) -> dict[T, dict[T, int]]:
+  """Distancias entre todos los pares de nodos (un BFS por nodo, O(V·(V + E)))."""
+  return {nodo: distancias(grafo, nodo) for nodo in grafo.nodos}
+
+
+def _reconstruir(predecesores: dict[T, Optional[T]], destino: T) -> list[T]:
+  camino = [destino]
+  while (anterior := predecesores[camino[-1]]) is not None:
+    camino.append(anterior)
+  camino.reverse()
+  return camino
+
+
+def camino_minimo(grafo: Adyacencia[T], origen: T, destino: T) -> Optional[list[T]]:
+  """Camino con menos aristas de origen a destino, o None si no hay ninguno."""
+  if destino not in grafo.nodos:
+    raise ValueError("No existe el nodo destino en el grafo")
+  _, predecesores = _bfs_arbol(grafo, origen, destino)
+  if destino not in predecesores:
+    return None
+  return _reconstruir(predecesores, destino)
+
+
+def tiene_ciclo(grafo: Adyacencia[T]) -> bool:
+  """Indica si el grafo tiene algún ciclo, incluidos los lazos.
+
+  Si el grafo tiene el atributo dirigido en True, vecinos_de se toma como
+  la lista de sucesores y se busca un ciclo dirigido.
+  """
+  if getattr(grafo, 'dirigido', False):
+    try:
+      orden_topologico(grafo)
+    except ValueError:
+      return True
+    return False
+  padres: dict[T, Optional[T]] = {}
+  for inicio in grafo.nodos:
+    if inicio in padres:
+      continue
+    padres[inicio] = None
+    pila = [inicio]
+    while pila:
+      nodo = pila.pop()
+      for vecino in grafo.vecinos_de(nodo):
+        if vecino == nodo:
+          return True # Lazo
+        if vecino not in padres:
+          padres[vecino] = nodo
+          pila.append(vecino)
+        elif vecino != padres[nodo]:
+          return True # Se llega por otro camino a un nodo ya descubierto
+  return False
+
+
+# Algoritmos para grafos dirigidos: vecinos_de(nodo) son los sucesores de nodo
+def orden_topologico(grafo: Adyacencia[T]) -> list[T]:
+  """Orden topológico con el algoritmo de Kahn, O(V + E). Falla si el grafo tiene ciclos."""
+  grado_entrante = {nodo: 0 for nodo in grafo.nodos}
+  for nodo in grafo.nodos:
+    for sucesor in grafo.vecinos_de(nodo):
+      grado_entrante[sucesor] += 1
+  cola = deque(nodo for nodo, grado in grado_entrante.items() if grado == 0)
+  orden: list[T] = []
+  while cola:
+    nodo = cola.popleft()
+    orden.append(nodo)
+    for sucesor in grafo.vecinos_de(nodo):
+      grado_entrante[sucesor] -= 1
+      if grado_entrante[sucesor] == 0:
+        cola.append(sucesor)
+  if len(orden) != len(grado_entrante):
+    raise ValueError("El grafo tiene ciclos: no hay orden topológico")
+  return orden
+
+
+def componentes_fuertemente_conexas(grafo: Adyacencia[T]) -> list[set[T]]:
+  """Componentes fuertemente conexas con el algoritmo de Tarjan (iterativo), O(V + E).
+
+  Las componentes salen en orden topológico inverso.
+  """
+  indice: dict[T, int] = {}
+  bajo: dict[T, int] = {}
+  pila: list[T] = []
+  en_pila: set[T] = set()
+  componentes: list[set[T]] = []
+
+  def descubrir(nodo: T) -> tuple[T, Iterator[T]]:
+    indice[nodo] = bajo[nodo] = len(indice)
+    pila.append(nodo)
+    en_pila.add(nodo)
+    return nodo, iter(grafo.vecinos_de(nodo))
+
+  for inicio in grafo.nodos:
+    if inicio in indice:
+      continue
+    # Cada entrada simula un llamado recursivo: el nodo y los sucesores que le faltan revisar
+    llamados = [descubrir(inicio)]
+    while llamados:
+      nodo, sucesores = llamados[-1]
+      for sucesor in sucesores:
+        if sucesor not in indice:
+          llamados.append(descubrir(sucesor))
+          break
+        if sucesor in en_pila:
+          bajo[nodo] = min(bajo[nodo], indice[sucesor])
+      else:
+        llamados.pop()
+        if llamados:
+          padre = llamados[-1][0]
+          bajo[padre] = min(bajo[padre], bajo[nodo])
+        if bajo[nodo] == indice[nodo]:
+          # nodo es la raíz de una componente: son los que están encima en la pila
+          componente: set[T] = set()
+          while True:
+            miembro = pila.pop()
+            en_pila.remove(miembro)
+            componente.add(miembro)
+            if miembro == nodo:
+              break
+          componentes.append(componente)
+  return componentes
+
+
+class CaminosMinimos(Generic[T]):
+  """Dijkstra desde un origen, con cola de prioridad binaria (heapq) y borrado perezoso.
+
+  El cálculo avanza solo hasta fijar el destino pedido y queda guardado: las
+  consultas siguientes desde el mismo origen se responden con el mapa de
+  predecesores ya calculado o retoman el cálculo donde quedó. Si el grafo se
+  modifica hay que crear un objeto nuevo.
+  """
+  def __init__(self, grafo: AdyacenciaPonderada[T], origen: T) -> None:
+    _validar_nodo(grafo, origen)
+    self.grafo = grafo
+    self.origen = origen
+    # Mejor distancia conocida y predecesor de cada nodo descubierto
+    self.distancias: dict[T, float] = {origen: 0}
+    self.predecesores: dict[T, Optional[T]] = {origen: None}
+    # Nodos cuya distancia ya es definitiva
+    self.fijados: set[T] = set()
+    # El contador desempata sin comparar nodos, que pueden no ser ordenables
+    self._contador = count()
+    self._cola: list[tuple[float, int, T]] = [(0, next(self._contador), origen)]
+
+  def _avanzar(self, destino: Optional[T] = None) -> None:
+    # Continúa Dijkstra hasta fijar destino (o hasta agotar la cola si es None)
+    cola = self._cola
+    distancias = self.distancias
+    while cola and destino not in self.fijados:
+      distancia, _, nodo = heapq.heappop(cola)
+      if nodo in self.fijados or distancia > distancias[nodo]:
+        continue # Entrada vieja: el nodo ya se fijó o se encontró un camino mejor
+      self.fijados.add(nodo)
+      for vecino, peso in self.grafo.vecinos_con_peso(nodo):
+        if peso < 0:
+          raise ValueError("Dijkstra no admite pesos negativos")
+        nueva = distancia + peso
+        if nueva < distancias.get(vecino, math.inf):
+          distancias[vecino] = nueva
+          self.predecesores[vecino] = nodo
+          heapq.heappush(cola, (nueva, next(self._contador), vecino))
+
+  def distancia(self, destino: T) -> float:
+    """Costo mínimo de origen a destino (math.inf si no es alcanzable)."""
+    if destino not in self.grafo.nodos:
+      raise ValueError("No existe el nodo destino en el grafo")
+    self._avanzar(destino)
+    return self.distancias[destino] if destino in self.fijados else math.inf
+
+  def camino(self, destino: T) -> Optional[list[T]]:
+    """Camino de costo mínimo de origen a destino, o None si no hay ninguno."""
+    if self.distancia(destino) == math.inf:
+      return None
+    return _reconstruir(self.predecesores, destino)
+
+  def completar(self) -> dict[T, float]:
+    """Calcula las distancias a todos los nodos alcanzables."""
+    self._avanzar()
+    return {nodo: self.distancias[nodo] for nodo in self.fijados}
+
+
+def dijkstra(grafo: AdyacenciaPonderada[T], origen: T, destino: Optional[T] = None) -> CaminosMinimos[T]:
+  """Calcula caminos mínimos desde origen; con destino se detiene apenas lo alcanza."""
+  caminos = CaminosMinimos(grafo, origen)
+  if destino is None:
+    caminos.completar()
+  else:
+    caminos.distancia(destino)
+  return caminos
+
+
+def a_estrella(
+  grafo: AdyacenciaPonderada[T],
+  origen: T,
+  destino: T,
+  heuristica: Callable[[T, T], float]
+) -> tuple[Optional[list[T]], float]:
+  """Camino de costo mínimo con A*. La heurística no debe sobreestimar el costo restante.
+
+  Devuelve el camino (None si no existe) y su costo. Un nodo al que se llega
+  después por un camino más barato se vuelve a expandir, así que alcanza con que
+  la heurística sea admisible (no hace falta que sea consistente).
+  """
+  _validar_nodo(grafo, origen)
+  if destino not in grafo.nodos:
+    raise ValueError("No existe el nodo destino en el grafo")
+  distancias: dict[T, float] = {origen: 0}
+  predecesores: dict[T, Optional[T]] = {origen: None}
+  contador = count()
+  # Cada entrada lleva el costo acumulado con el que se encoló: (estimación total, desempate, costo, nodo)
+  cola: list[tuple[float, int, float, T]] = [(heuristica(origen, destino), next(contador), 0, origen)]
+  while cola:
+    _, _, distancia, nodo = heapq.heappop(cola)
+    if distancia > distancias[nodo]:
+      continue # Entrada vieja: después se encontró un camino mejor a este nodo
+    if nodo == destino:
+      return _reconstruir(predecesores, destino), distancia
+    for vecino, peso in grafo.vecinos_con_peso(nodo):
+      if peso < 0:
+        raise ValueError("A* no admite pesos negativos")
+      nueva = distancia + peso
+      if nueva < distancias.get(vecino, math.inf):
+        distancias[vecino] = nueva
+        predecesores[vecino] = nodo
+        heapq.heappush(cola, (nueva + heuristica(vecino, destino), next(contador), nueva, vecino))
+  return None, math.inf
+
+
+if __name__ == '__main__':
+  from grafo_adyacencia import GrafoAdyacencia
+  grafo = GrafoAdyacencia()
+  for nodo in range(1, 8):
+    grafo.agregar_nodo(nodo)
+  grafo.agregar_arista(1, 2)
+  grafo.agregar_arista(1, 3)
+  grafo.agregar_arista(3, 4)
+  grafo.agregar_arista(4, 5)
+  grafo.agregar_arista(6, 7)
+  print("BFS desde 1:", list(bfs(grafo, 1)))
+  print("DFS desde 1:", list(dfs(grafo, 1)))
+  print("Componentes:", componentes_conexas(grafo))
+  print("Distancias desde 1:", distancias(grafo, 1))
+  print("Camino 2 -> 5:", camino_minimo(grafo, 2, 5))
+  print("Tiene ciclo:", tiene_ciclo(grafo))
+  grafo.agregar_arista(2, 4)
+  print("Tiene ciclo luego de agregar (2, 4):", tiene_ciclo(grafo))
+  grafo.eliminar_arista(1, 3)
+  grafo.agregar_arista(1, 3, 10)
+  caminos = dijkstra(grafo, 1, 5)
+  print("Dijkstra 1 -> 5:", caminos.camino(5), caminos.distancia(5))
+  print("Dijkstra 1 -> 3 (desde el mismo cálculo):", caminos.camino(3), caminos.distancia(3))
+  print("A* 1 -> 5:", a_estrella(grafo, 1, 5, lambda nodo, destino: 0))
+  # Heurística admisible pero no consistente: A* tiene que reabrir nodos para dar el mínimo (19)
+  ponderado = GrafoAdyacencia.desde_lista_aristas([
+    (0, 2, 2), (0, 4, 5), (0, 5, 10), (1, 3, 3), (1, 4, 10), (1, 5, 3), (1, 6, 8),
+    (2, 3, 6), (3, 4, 7), (3, 5, 1), (4, 5, 4),
+  ])
+  estimado = {0: 19, 1: 4, 2: 2, 3: 10, 4: 9, 5: 7, 6: 0}
+  camino, costo = a_estrella(ponderado, 0, 6, lambda nodo, destino: estimado[nodo])
+  assert costo == dijkstra(ponderado, 0, 6).distancia(6) == 19
+  print("A* 0 -> 6 (heurística no consistente):", camino, costo)
+  dirigido = GrafoAdyacencia(dirigido=True)
+  for nodo in "abcde":
+    dirigido.agregar_nodo(nodo)
+  dirigido.agregar_arista("a", "b")
+  dirigido.agregar_arista("b", "c")
+  dirigido.agregar_arista("c", "d")
+  dirigido.agregar_arista("a", "e")
+  print("Orden topológico:", orden_topologico(dirigido))
+  dirigido.agregar_arista("d", "b")
+  print("Componentes fuertemente conexas:", componentes_fuertemente_conexas(dirigido))
+  print("Tiene ciclo:", tiene_ciclo(dirigido))
@@ -0,0 +1,157 @@
+# Recorridos por lotes repartidos en varios procesos sobre una foto GrafoCSR.
+# Los procesos no reciben el grafo por pickle: cada uno mapea al iniciar el mismo
+# archivo (ver GrafoCSR.guardar/cargar) y así comparten sus páginas en memoria.
+# Si el grafo no se cargó de un archivo, se escribe uno temporal.
+import math
+import os
+import tempfile
+from array import array
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Optional, TypeVar
+from grafo_csr import GrafoCSR
+
+T = TypeVar('T')
+
+# Tareas por proceso: más de una para repartir mejor cuando los BFS tardan distinto
+TAREAS_POR_PROCESO = 4
+
+# Grafo mapeado en cada proceso trabajador (lo asigna _iniciar_trabajador)
+_grafo: Optional[GrafoCSR] = None
+
+
+def _iniciar_trabajador(ruta: str) -> None:
+  global _grafo
+  _grafo = GrafoCSR.cargar(ruta)
+
+
+@contextmanager
+def _archivo_compartido(grafo: GrafoCSR[T]) -> Iterator[str]:
+  if grafo._ruta is not None:
+    yield grafo._ruta
+    return
+  with tempfile.TemporaryDirectory() as directorio:
+    ruta = os.path.join(directorio, 'grafo.csr')
+    grafo.guardar(ruta)
+    yield ruta
+
+
+def _repartir(ids: list[int], partes: int) -> list[list[int]]:
+  tamano = max(1, math.ceil(len(ids) / partes))
+  return [ids[i:i + tamano] for i in range(0, len(ids), tamano)]
+
+
+def _en_paralelo(grafo: GrafoCSR[T], tarea, lotes: list, procesos: Optional[int]) -> Iterator:
+  # Resultados de tarea(lote) para cada lote, en el orden de los lotes
+  with _archivo_compartido(grafo) as ruta:
+    with ProcessPoolExecutor(procesos, initializer=_iniciar_trabajador, initargs=(ruta,)) as ejecutor:
+      yield from ejecutor.map(tarea, lotes)
+
+
+def _ids_de(grafo: GrafoCSR[T], nodos: Iterable[T]) -> list[int]:
+  # Se valida todo antes de lanzar procesos
+  return [grafo.index_nodo(nodo) for nodo in nodos]
+
+
+def _cantidades(origenes: list[int]) -> list[int]:
+  return [len(_grafo.bfs_id(origen)) for origen in origenes]
+
+
+def cantidad_alcanzables_en_paralelo(
+  grafo: GrafoCSR[T], origenes: Iterable[T], procesos: Optional[int] = None
+) -> dict[T, int]:
+  """Cantidad de nodos alcanzables (incluido él mismo) desde cada origen."""
+  ids = _ids_de(grafo, origenes)
+  partes = (procesos or os.cpu_count() or 1) * TAREAS_POR_PROCESO
+  cantidades = [c for lote in _en_paralelo(grafo, _cantidades, _repartir(ids, partes), procesos) for c in lote]
+  return {grafo.lista_nodos[i]: cantidad for i, cantidad in zip(ids, cantidades)}
+
+
+def _distancias(tarea: tuple[list[int], Optional[list[int]]]) -> list[dict[int, int]]:
+  origenes, destinos = tarea
+  resultado = []
+  for origen in origenes:
+    distancias = _grafo.distancias_id(origen)
+    if destinos is None:
+      resultado.append({j: d for j, d in enumerate(distancias) if d >= 0})
+    else:
+      resultado.append({j: distancias[j] for j in destinos if distancias[j] >= 0})
+  return resultado
+
+
+def distancias_en_paralelo(
+  grafo: GrafoCSR[T],
+  origenes: Iterable[T],
+  destinos: Optional[Iterable[T]] = None,
+  procesos: Optional[int] = None
+) -> dict[T, dict[T, int]]:
+  """Cantidad mínima de aristas desde cada origen a cada nodo alcanzable.
+
+  Con destinos solo se devuelven las distancias hacia esos nodos, lo que
+  achica mucho lo que vuelve de cada proceso cuando hay miles de orígenes.
+  """
+  ids = _ids_de(grafo, origenes)
+  ids_destinos = None if destinos is None else _ids_de(grafo, destinos)
+  partes = (procesos or os.cpu_count() or 1) * TAREAS_POR_PROCESO
+  lotes = [(lote, ids_destinos) for lote in _repartir(ids, partes)]
+  lista_nodos = grafo.lista_nodos
+  resultado: dict[T, dict[T, int]] = {}
+  por_origen = (d for lote in _en_paralelo(grafo, _distancias, lotes, procesos) for d in lote)
+  for origen, distancias in zip(ids, por_origen):
+    resultado[lista_nodos[origen]] = {lista_nodos[j]: d for j, d in distancias.items()}
+  return resultado
+
+
+def _raiz(padres: array, i: int) -> int:
+  while padres[i] != i:
+    padres[i] = padres[padres[i]]  # Compresión por mitades
+    i = padres[i]
+  return i
+
+
+def _bosque(rango: tuple[int, int]) -> array:
+  # Aristas de un bosque generador de las filas [desde, hasta): las que unieron dos componentes
+  desde, hasta = rango
+  desplazamientos, vecinos = _grafo.desplazamientos, _grafo.vecinos
+  padres = array('l', range(len(_grafo)))
+  bosque = array('l')
+  for i in range(desde, hasta):
+    for j in vecinos[desplazamientos[i]:desplazamientos[i + 1]]:
+      raiz_i, raiz_j = _raiz(padres, i), _raiz(padres, j)
+      if raiz_i != raiz_j:
+        padres[raiz_i] = raiz_j
+        bosque.append(i)
+        bosque.append(j)
+  return bosque
+
+
+def componentes_conexas_en_paralelo(grafo: GrafoCSR[T], procesos: Optional[int] = None) -> list[set[T]]:
+  """Componentes conexas (débilmente conexas si el grafo es dirigido).
+
+  Cada proceso arma un bosque generador de una franja de filas; el proceso
+  principal une los bosques, que tienen a lo sumo V - 1 aristas cada uno.
+  """
+  cantidad = len(grafo)
+  partes = procesos or os.cpu_count() or 1
+  cortes = [cantidad * k // partes for k in range(partes + 1)]
+  rangos = [(desde, hasta) for desde, hasta in zip(cortes, cortes[1:]) if desde < hasta]
+  padres = array('l', range(cantidad))
+  for bosque in _en_paralelo(grafo, _bosque, rangos, procesos):
+    for k in range(0, len(bosque), 2):
+      raiz_i, raiz_j = _raiz(padres, bosque[k]), _raiz(padres, bosque[k + 1])
+      if raiz_i != raiz_j:
+        padres[raiz_i] = raiz_j
+  componentes: dict[int, set[T]] = {}
+  for i, nodo in enumerate(grafo.lista_nodos):
+    componentes.setdefault(_raiz(padres, i), set()).add(nodo)
+  return list(componentes.values())
+
+
+if __name__ == '__main__':
+  from grafo_adyacencia import GrafoAdyacencia
+  grafo = GrafoAdyacencia.desde_lista_aristas([(1, 2), (2, 3), (3, 4), (5, 6)], nodos=[7])
+  foto = grafo.freeze()
+  print("Alcanzables:", cantidad_alcanzables_en_paralelo(foto, [1, 5, 7], procesos=2))
+  print("Distancias a 4:", distancias_en_paralelo(foto, [1, 2, 5], destinos=[4], procesos=2))
+  print("Componentes:", componentes_conexas_en_paralelo(foto, procesos=2))
@@ -0,0 +1,245 @@
+from collections.abc import Iterator
+from typing import Any, Protocol
+
+# NumPy es opcional y se importa recién al crear un AlmacenNumpy: importar este
+# módulo (y matriz_adyacencia, que usa AlmacenBits por defecto) no lo carga
+np: Any = None
+
+
+def _importar_numpy() -> None:
+  global np
+  if np is None:
+    try:
+      import numpy
+    except ImportError:
+      raise ImportError("AlmacenNumpy requiere NumPy") from None
+    np = numpy
+
+
+class AlmacenMatriz(Protocol):
+  """Almacenamiento de la matriz de adyacencia de MatrizAdyacencia.
+
+  Las filas/columnas se identifican por índice. Las que están fuera de uso
+  (índice >= n, la cantidad de nodos) se mantienen siempre en cero.
+  """
+  def capacidad(self) -> int: ...
+  def reservar(self, capacidad: int) -> None: ...
+  def poner(self, i: int, j: int, valor: bool) -> None: ...
+  # Enciende las celdas (filas[k], columnas[k]) de una vez
+  def poner_lote(self, filas: list[int], columnas: list[int]) -> None: ...
+  def hay(self, i: int, j: int) -> bool: ...
+  def vecinos(self, i: int) -> Iterator[int]: ...
+  def grado(self, i: int) -> int: ...
+  def grados(self, n: int) -> list[int]: ...
+  # Borra la fila/columna i y mueve allí la última en uso (n - 1)
+  def quitar(self, i: int, n: int) -> None: ...
+  def filas(self, n: int) -> list[list[int]]: ...
+  # Cantidad de vecinos en común, es decir (A·A)[i][j]
+  def vecinos_comunes(self, i: int, j: int) -> int: ...
+  # Cantidad de triángulos del grafo, sin contar lazos
+  def triangulos(self, n: int) -> int: ...
+
+
+class AlmacenListas:
+  """Matriz densa como lista de listas de enteros 0/1 (la representación original)."""
+  def __init__(self) -> None:
+    self.matriz: list[list[int]] = []
+
+  def capacidad(self) -> int:
+    return len(self.matriz)
+
+  def reservar(self, capacidad: int) -> None:
+    anterior = len(self.matriz)
+    for fila in self.matriz:
+      fila.extend([0] * (capacidad - anterior))
+    self.matriz.extend([0] * capacidad for _ in range(capacidad - anterior))
+
+  def poner(self, i: int, j: int, valor: bool) -> None:
+    self.matriz[i][j] = 1 if valor else 0
+
+  def poner_lote(self, filas: list[int], columnas: list[int]) -> None:
+    matriz = self.matriz
+    for i, j in zip(filas, columnas):
+      matriz[i][j] = 1
+
+  def hay(self, i: int, j: int) -> bool:
+    return self.matriz[i][j] == 1
+
+  def vecinos(self, i: int) -> Iterator[int]:
+    return (j for j, valor in enumerate(self.matriz[i]) if valor == 1)
+
+  def grado(self, i: int) -> int:
+    return sum(self.matriz[i])
+
+  def grados(self, n: int) -> list[int]:
+    return [sum(fila) for fila in self.matriz[:n]]
+
+  def quitar(self, i: int, n: int) -> None:
+    ultimo = n - 1
+    matriz = self.matriz
+    if i != ultimo:
+      matriz[i], matriz[ultimo] = matriz[ultimo], matriz[i]
+      for fila in matriz[:n]:
+        fila[i] = fila[ultimo]
+    matriz[ultimo] = [0] * len(matriz)
+    for fila in matriz[:ultimo]:
+      fila[ultimo] = 0
+
+  def filas(self, n: int) -> list[list[int]]:
+    return [fila[:n] for fila in self.matriz[:n]]
+
+  def vecinos_comunes(self, i: int, j: int) -> int:
+    return sum(a & b for a, b in zip(self.matriz[i], self.matriz[j]))
+
+  def triangulos(self, n: int) -> int:
+    total = 0
+    for i in range(n):
+      for j in self.vecinos(i):
+        if j > i:
+          total += sum(1 for k in self.vecinos(j) if k > j and self.matriz[i][k] == 1)
+    return total
+
+
+class AlmacenBits:
+  """Cada fila es un entero de Python usado como conjunto de bits: n² bits en lugar de n² enteros.
+
+  Grados, vecinos en común y triángulos se calculan con operaciones sobre
+  filas completas (&, bit_count) en vez de recorrer celda por celda.
+  """
+  def __init__(self) -> None:
+    self.filas_bits: list[int] = []
+
+  def capacidad(self) -> int:
+    return len(self.filas_bits)
+
+  def reservar(self, capacidad: int) -> None:
+    # Las filas crecen solas: alcanza con agregar filas vacías
+    self.filas_bits.extend(0 for _ in range(capacidad - len(self.filas_bits)))
+
+  def poner(self, i: int, j: int, valor: bool) -> None:
+    if valor:
+      self.filas_bits[i] |= 1 << j
+    else:
+      self.filas_bits[i] &= ~(1 << j)
+
+  def poner_lote(self, filas: list[int], columnas: list[int]) -> None:
+    # Cada |= copia la fila entera: se arma una máscara por fila y se aplica una sola vez
+    por_fila: dict[int, list[int]] = {}
+    for i, j in zip(filas, columnas):
+      por_fila.setdefault(i, []).append(j)
+    for i, columnas_fila in por_fila.items():
+      mascara = bytearray(max(columnas_fila) // 8 + 1)
+      for j in columnas_fila:
+        mascara[j >> 3] |= 1 << (j & 7)
+      self.filas_bits[i] |= int.from_bytes(mascara, 'little')
+
+  def hay(self, i: int, j: int) -> bool:
+    return (self.filas_bits[i] >> j) & 1 == 1
+
+  def vecinos(self, i: int) -> Iterator[int]:
+    fila = self.filas_bits[i]
+    while fila:
+      bajo = fila & -fila  # Bit encendido más bajo
+      yield bajo.bit_length() - 1
+      fila ^= bajo
+
+  def grado(self, i: int) -> int:
+    return self.filas_bits[i].bit_count()
+
+  def grados(self, n: int) -> list[int]:
+    return [fila.bit_count() for fila in self.filas_bits[:n]]
+
+  def quitar(self, i: int, n: int) -> None:
+    ultimo = n - 1
+    filas = self.filas_bits
+    filas[i] = filas[ultimo]
+    filas[ultimo] = 0
+    limpiar = ~((1 << i) | (1 << ultimo))
+    for k in range(ultimo):
+      fila = filas[k]
+      if i == ultimo:
+        filas[k] = fila & limpiar
+      else:
+        # La columna del último pasa a la columna i, y la del último queda en cero
+        filas[k] = (fila & limpiar) | (((fila >> ultimo) & 1) << i)
+
+  def filas(self, n: int) -> list[list[int]]:
+    return [[(fila >> j) & 1 for j in range(n)] for fila in self.filas_bits[:n]]
+
+  def vecinos_comunes(self, i: int, j: int) -> int:
+    return (self.filas_bits[i] & self.filas_bits[j]).bit_count()
+
+  def triangulos(self, n: int) -> int:
+    # Cada triángulo se cuenta una vez por cada una de sus tres aristas
+    filas = self.filas_bits
+    total = 0
+    for i in range(n):
+      sin_lazo_i = filas[i] & ~(1 << i)
+      for j in self.vecinos(i):
+        if j > i:
+          total += (sin_lazo_i & filas[j] & ~(1 << j)).bit_count()
+    return total // 3
+
+
+class AlmacenNumpy:
+  """Matriz densa de NumPy (bool, un byte por celda) con operaciones vectorizadas.
+
+  Los triángulos se cuentan con un producto de matrices: suma((A·A) ∘ A) / 6.
+  """
+  def __init__(self) -> None:
+    _importar_numpy()
+    self.matriz = np.zeros((0, 0), dtype=bool)
+
+  def __setstate__(self, estado: dict) -> None:
+    # Al leerlo con pickle en otro proceso no pasa por __init__
+    _importar_numpy()
+    self.__dict__.update(estado)
+
+  def capacidad(self) -> int:
+    return self.matriz.shape[0]
+
+  def reservar(self, capacidad: int) -> None:
+    anterior = self.matriz.shape[0]
+    nueva = np.zeros((capacidad, capacidad), dtype=bool)
+    nueva[:anterior, :anterior] = self.matriz
+    self.matriz = nueva
+
+  def poner(self, i: int, j: int, valor: bool) -> None:
+    self.matriz[i, j] = valor
+
+  def poner_lote(self, filas: list[int], columnas: list[int]) -> None:
+    self.matriz[filas, columnas] = True
+
+  def hay(self, i: int, j: int) -> bool:
+    return bool(self.matriz[i, j])
+
+  def vecinos(self, i: int) -> Iterator[int]:
+    return iter(np.flatnonzero(self.matriz[i]).tolist())
+
+  def grado(self, i: int) -> int:
+    return int(np.count_nonzero(self.matriz[i]))
+
+  def grados(self, n: int) -> list[int]:
+    return np.count_nonzero(self.matriz[:n, :n], axis=1).tolist()
+
+  def quitar(self, i: int, n: int) -> None:
+    ultimo = n - 1
+    matriz = self.matriz
+    if i != ultimo:
+      matriz[i, :n] = matriz[ultimo, :n]
+      matriz[:n, i] = matriz[:n, ultimo]
+    matriz[ultimo, :] = False
+    matriz[:, ultimo] = False
+
+  def filas(self, n: int) -> list[list[int]]:
+    return self.matriz[:n, :n].astype(int).tolist()
+
+  def vecinos_comunes(self, i: int, j: int) -> int:
+    return int(np.count_nonzero(self.matriz[i] & self.matriz[j]))
+
+  def triangulos(self, n: int) -> int:
+    # Producto en punto flotante para usar BLAS; los conteos por celda son exactos
+    a = self.matriz[:n, :n].astype(np.float32)
+    np.fill_diagonal(a, 0)
+    caminos = a @ a
+    return int(round(float((caminos * a).sum(dtype=np.float64)) / 6))
@@ -0,0 +1,116 @@
+from typing import BinaryIO
+from arbol_binario_ordenado import ArbolBinarioOrdenado, NodoABO, T
+
+
+class NodoAVL(NodoABO[T]):
+    __slots__ = ()
+
+    # Los subárboles de un nodo AVL también son AVL
+    def _arbol_vacio(self) -> "ArbolAVL[T]":
+        return ArbolAVL()
+
+
+class ArbolAVL(ArbolBinarioOrdenado[T]):
+    """Árbol binario ordenado que se rebalancea (rotaciones AVL) al insertar y eliminar.
+
+    Mantiene la altura en O(log n) para cualquier orden de inserción, por lo que
+    pertenece, minimo, maximo, insertar y eliminar son O(log n).
+    Insertar subárboles a mano con insertar_si/insertar_sd no rebalancea.
+    """
+    __slots__ = ()
+
+    @staticmethod
+    def crear_nodo(dato: T) -> "ArbolAVL[T]":
+        nuevo = ArbolAVL()
+        nuevo.set_raiz(NodoAVL(dato))
+        return nuevo
+
+    def _nodo_nuevo(self, valor: T) -> NodoAVL[T]:
+        return NodoAVL(valor)
+
+    def es_balanceado(self) -> bool:
+        # En cada nodo las alturas de los subárboles difieren en a lo sumo 1 (se leen de la aumentación)
+        return all(abs(nodo._si._altura() - nodo._sd._altura()) <= 1 for nodo in self._nodos_preorder())
+
+    @classmethod
+    def cargar(cls, archivo: BinaryIO) -> "ArbolAVL[T]":
+        """Como ArbolBinarioOrdenado.cargar; un archivo con forma que no está balanceado se rearma balanceado."""
+        arbol = super().cargar(archivo)
+        if not arbol.es_balanceado():
+            return cls.desde_ordenados(arbol.iter_inorder())
+        return arbol
+
+    @staticmethod
+    def _rotar_derecha(arbol: "ArbolAVL[T]"):
+        # Las envolturas no cambian de lugar: solo se intercambian sus raíces.
+        # El hijo se pide con _izquierdo(): en un árbol con fotos puede estar fuera del camino copiado
+        x = arbol.raiz
+        izquierdo = arbol._izquierdo()
+        y = izquierdo.raiz
+        x._si = y._sd
+        y._sd = izquierdo
+        izquierdo.raiz = x
+        arbol.raiz = y
+        izquierdo._enlazar()
+        arbol._enlazar()
+        izquierdo._actualizar()
+        arbol._actualizar()
+
+    @staticmethod
+    def _rotar_izquierda(arbol: "ArbolAVL[T]"):
+        x = arbol.raiz
+        derecho = arbol._derecho()
+        y = derecho.raiz
+        x._sd = y._si
+        y._si = derecho
+        derecho.raiz = x
+        arbol.raiz = y
+        derecho._enlazar()
+        arbol._enlazar()
+        derecho._actualizar()
+        arbol._actualizar()
+
+    @staticmethod
+    def _balancear(arbol: "ArbolAVL[T]"):
+        nodo = arbol.raiz
+        factor = nodo._si._altura() - nodo._sd._altura()
+        if factor > 1:
+            hijo = nodo._si.raiz
+            if hijo._si._altura() < hijo._sd._altura():
+                ArbolAVL._rotar_izquierda(arbol._izquierdo())
+            ArbolAVL._rotar_derecha(arbol)
+        elif factor < -1:
+            hijo = nodo._sd.raiz
+            if hijo._sd._altura() < hijo._si._altura():
+                ArbolAVL._rotar_derecha(arbol._derecho())
+            ArbolAVL._rotar_izquierda(arbol)
+        else:
+            arbol._actualizar()
+
+    def _despues_de_modificar(self, camino: "list[ArbolAVL[T]]"):
+        # Se recorre el camino de abajo hacia arriba corrigiendo alturas y rotando
+        for arbol in reversed(camino):
+            if arbol.raiz is not None:
+                ArbolAVL._balancear(arbol)
+        # Las rotaciones pueden cambiar la altura vista por los ancestros del árbol modificado
+        camino[0]._propagar()
+
+
+def main():
+    t: ArbolAVL[int] = ArbolAVL()
+    for i in range(1, 1025):
+        t.insertar(i)
+    print(f'Nodos: {len(t)}')
+    print(f'Altura: {t.altura()}')
+    print(f'Tiene 512: {t.pertenece(512)}')
+    print(f'minimo: {t.minimo()}')
+    print(f'maximo: {t.maximo()}')
+    for i in range(1, 513):
+        t.eliminar(i)
+    print(f'Nodos luego de eliminar: {len(t)}')
+    print(f'Altura luego de eliminar: {t.altura()}')
+    print(f'minimo: {t.minimo()}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,29 +1,103 @@
-from collections.abc import Callable
-from typing import Any, Generic, Optional, TypeVar
+from collections import deque
+from itertools import chain
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, BinaryIO, Generic, Optional, TextIO, TypeVar
 from functools import wraps
 from copy import copy
 from funciones_grafico import grafico_arbol_binario
+import exportar
+import serializacion_arbol
 
 T = TypeVar('T')
 
+class _Version:
+    # Versión dueña de los subárboles de un árbol con fotos (ver snapshot). Al tomar una foto la
+    # versión anterior muere: sus subárboles quedan compartidos por ambos árboles y solo se leen
+    __slots__ = ('viva',)
+
+    def __init__(self, viva: bool = True):
+        self.viva = viva
+
+    def __reduce__(self) -> Any:
+        return _Version, (self.viva,)
+
 class NodoAB(Generic[T]):
+    # Sin __dict__: cada nodo ocupa solo estos campos
+    __slots__ = ('dato', '_si', '_sd', 'cantidad', 'altura')
+
     # Inicializador de la clase
     def __init__(self, dato: T, si: "Optional[ArbolBinario[T]]" = None, sd: "Optional[ArbolBinario[T]]" = None):
         # Almacena el dato en el nodo
         self.dato = dato
-        # Inicializa el subárbol izquierdo (si) o crea un nuevo ArbolBinario si no se proporciona
-        self.si: ArbolBinario[T] = ArbolBinario() if (si is None) else si
-        # Inicializa el subárbol derecho (sd) o crea un nuevo ArbolBinario si no se proporciona
-        self.sd: ArbolBinario[T] = ArbolBinario() if (sd is None) else sd
+        # Los subárboles vacíos comparten el centinela _VACIO hasta que alguien los pide con si()/sd()
+        if si is None and sd is None:
+            # Caso común (insertar, cargar): una hoja, sin consultar a los subárboles
+            self._si: ArbolBinario[T] = _VACIO
+            self._sd: ArbolBinario[T] = _VACIO
+            self.cantidad: int = 1
+            self.altura: int = 1
+            return
+        self._si = _VACIO if (si is None) else si
+        self._sd = _VACIO if (sd is None) else sd
+        # Aumentación: cantidad de nodos y altura del subárbol con raíz en este nodo (altura 0 = pendiente)
+        self.cantidad = 1 + self._si._cantidad() + self._sd._cantidad()
+        self.altura = 1 + max(self._si._altura(), self._sd._altura())
+
+    # Crea el subárbol vacío que reemplaza al centinela (las subclases lo redefinen)
+    def _arbol_vacio(self) -> "ArbolBinario[T]":
+        return ArbolBinario()
+
+    def _copia(self) -> "NodoAB[T]":
+        # Copia superficial para la copia de caminos: comparte los subárboles y el dato
+        nuevo = object.__new__(type(self))
+        nuevo.dato = self.dato
+        nuevo._si = self._si
+        nuevo._sd = self._sd
+        nuevo.cantidad = self.cantidad
+        nuevo.altura = self.altura
+        return nuevo
+
+    # Solo lectura: si el subárbol está vacío se devuelve el centinela, que no se modifica
+    @property
+    def si(self) -> "ArbolBinario[T]":
+        return self._si
+
+    # Sin setter público: un subárbol colgado a mano no actualizaría len()/altura() ni el enlace al padre
+    @si.setter
+    def si(self, arbol: "ArbolBinario[T]"):
+        raise AttributeError("El subárbol izquierdo se cambia con insertar_si() del árbol")
+
+    @property
+    def sd(self) -> "ArbolBinario[T]":
+        return self._sd
+
+    @sd.setter
+    def sd(self, arbol: "ArbolBinario[T]"):
+        raise AttributeError("El subárbol derecho se cambia con insertar_sd() del árbol")
 
     def __str__(self):
         # Devuelve el dato del nodo como una cadena (dato)
         return self.dato
     
 class ArbolBinario(Generic[T]):
+    __slots__ = ('raiz', '_padre', '_version', '_niveles')
+
     def __init__(self):
         # La raíz del árbol se inicializa como None, indicando que el árbol está vacío
         self.raiz: Optional[NodoAB[T]] = None
+        # Árbol del que cuelga este subárbol (None si es la raíz), para propagar la aumentación
+        self._padre: Optional[ArbolBinario[T]] = None
+        # Versión dueña de este subárbol (ver snapshot); None mientras nunca se tomó una foto
+        self._version: Optional[_Version] = None
+        # Índice dato -> nivel armado por indexar_niveles(); se descarta al modificar el árbol
+        self._niveles: Optional[dict[T, int]] = None
+
+    def __reduce_ex__(self, protocolo: Any) -> Any:
+        # El centinela se guarda por su nombre: pickle, copy y deepcopy devuelven el mismo objeto, y
+        # los subárboles vacíos de la copia se siguen reconociendo como vacíos (no se les cuelga nada)
+        if self is _VACIO:
+            return '_VACIO'
+        return super().__reduce_ex__(protocolo)
         
     class _Decoradores:
         
@@ -31,7 +105,7 @@ class ArbolBinario(Generic[T]):
         def valida_es_vacio(cls, f: Callable[..., Any]) -> Callable[..., Any]:
             @wraps(f) # Mantiene la metadata del método original
             def wrapper(self, *args: Any, **kwargs: Any) -> Any:
-                if self.es_vacio():
+                if self.raiz is None: # Igual que es_vacio(), sin una llamada extra por acceso
                     raise TypeError('Arbol Vacio')
                 return f(self, *args, **kwargs) # Llama al método original si no está vacío
             return wrapper
@@ -39,9 +113,13 @@ class ArbolBinario(Generic[T]):
     @staticmethod
     def crear_nodo(dato: T, si: "Optional[ArbolBinario[T]]" = None, sd: "Optional[ArbolBinario[T]]" = None) -> "ArbolBinario[T]":
         t = ArbolBinario() # Crea una nueva instancia de ArbolBinario
-        t.raiz = NodoAB(dato, si, sd) # Asigna un nuevo nodo a la raíz con los subárboles proporcionados
+        t.set_raiz(NodoAB(dato, si, sd)) # Asigna un nuevo nodo a la raíz con los subárboles proporcionados
         return t
 
+    # Crea el nodo para un dato nuevo (las subclases lo redefinen)
+    def _nodo_nuevo(self, dato: T) -> NodoAB[T]:
+        return NodoAB(dato)
+
     def es_vacio(self) -> bool:
         # Retorna True si la raíz del arbol es None
         return self.raiz is None
@@ -49,19 +127,147 @@ class ArbolBinario(Generic[T]):
     @_Decoradores.valida_es_vacio # Aplica el decorador para validar si el árbol está vacío (si no tiene raiz)
     def si(self) -> "ArbolBinario[T]":
         # funcion que devuelve el subarbol izquierdo
-        assert self.raiz is not None  # Asegura que la raíz no sea None
-        return self.raiz.si  # Retorna el subárbol izquierdo
+        assert self.raiz is not None
+        if self.raiz._si is _VACIO and not self._es_compartido():
+            return self._izquierdo()  # Uno vacío propio, para poder colgarle algo con set_raiz
+        return self.raiz._si  # Retorna el subárbol izquierdo (compartido con una foto, si lo es)
     
     @_Decoradores.valida_es_vacio # Aplica el decorador para validar si el árbol está vacío (si no tiene raiz)
     def sd(self) -> "ArbolBinario[T]":
         # funcion que devuelve el subarbol derecho
-        assert self.raiz is not None  # Asegura que la raíz no sea None
-        return self.raiz.sd  # Retorna el subárbol derecho
+        assert self.raiz is not None
+        if self.raiz._sd is _VACIO and not self._es_compartido():
+            return self._derecho()  # Uno vacío propio, para poder colgarle algo con set_raiz
+        return self.raiz._sd  # Retorna el subárbol derecho (compartido con una foto, si lo es)
     
+    # Acceso interno sin validar para los algoritmos que modifican el árbol, que ya saben que hay raíz.
+    # Devuelven el subárbol propio (creándolo si era el centinela, o copiándolo si es compartido
+    # con una foto) enlazado a este árbol.
+    def _izquierdo(self) -> "ArbolBinario[T]":
+        nodo = self.raiz
+        assert nodo is not None
+        hijo = nodo._si
+        if hijo is _VACIO or (hijo._version is not None and not hijo._version.viva):
+            nodo._si = hijo = self._propio(hijo)
+        hijo._padre = self
+        return hijo
+
+    def _derecho(self) -> "ArbolBinario[T]":
+        nodo = self.raiz
+        assert nodo is not None
+        hijo = nodo._sd
+        if hijo is _VACIO or (hijo._version is not None and not hijo._version.viva):
+            nodo._sd = hijo = self._propio(hijo)
+        hijo._padre = self
+        return hijo
+
+    # Árboles persistentes: snapshot() es O(1) porque la foto comparte todos los nodos. Cada subárbol
+    # guarda la versión dueña; los de una versión muerta son compartidos y no se modifican nunca:
+    # las lecturas los devuelven tal cual y las modificaciones los copian (solo el nodo, compartiendo
+    # sus hijos) al bajar por ellos. Así una modificación copia su camino, O(altura).
+    def _es_compartido(self) -> bool:
+        return self is _VACIO or (self._version is not None and not self._version.viva)
+
+    def _propio(self, hijo: "ArbolBinario[T]") -> "ArbolBinario[T]":
+        assert self.raiz is not None
+        if hijo is _VACIO:
+            nuevo = self.raiz._arbol_vacio()
+        else:
+            nuevo = type(hijo)()
+            nuevo.raiz = None if hijo.raiz is None else hijo.raiz._copia()
+        nuevo._version = self._version
+        return nuevo
+
+    def _validar_version(self):
+        # Un subárbol compartido con una foto (leído con si()/sd(), u obtenido antes de la última foto)
+        # solo se lee: modificarlo cambiaría también la foto
+        if self._es_compartido():
+            raise ValueError("El subárbol es compartido con una foto: se modifica desde la raíz del árbol")
+
+    def _injertable(self, arbol: "ArbolBinario[T]") -> "ArbolBinario[T]":
+        # Uno compartido se injerta copiando su raíz; uno nuevo pasa a ser de esta versión, y uno
+        # propio de otro árbol con fotos se copia (sus partes compartidas se siguen compartiendo)
+        if arbol._es_compartido():
+            return self._propio(arbol)
+        if arbol._version is self._version:
+            return arbol
+        if arbol._version is None:
+            arbol._sellar(self._version)
+            return arbol
+        return arbol._copia_propia(self._version)
+
+    def _sellar(self, version: Optional[_Version]):
+        # Pasa a version los subárboles sin versión (los de un árbol que nunca tuvo fotos): O(tamaño)
+        pila: list[ArbolBinario[T]] = [self]
+        while pila:
+            arbol = pila.pop()
+            arbol._version = version
+            if arbol.raiz is not None:
+                for hijo in (arbol.raiz._si, arbol.raiz._sd):
+                    if hijo is not _VACIO and hijo._version is None:
+                        pila.append(hijo)
+
+    def _copia_propia(self, version: Optional[_Version]) -> "ArbolBinario[T]":
+        # Copia de la estructura para la versión dada, en O(tamaño): comparte los datos y los subárboles compartidos
+        copia = type(self)()
+        copia.raiz = None if self.raiz is None else self.raiz._copia()
+        copia._version = version
+        pila = [] if copia.raiz is None else [copia]
+        while pila:
+            arbol = pila.pop()
+            nodo = arbol.raiz
+            assert nodo is not None
+            if not nodo._si._es_compartido():
+                nodo._si = hijo = arbol._propio(nodo._si)
+                hijo._padre = arbol
+                if hijo.raiz is not None:
+                    pila.append(hijo)
+            if not nodo._sd._es_compartido():
+                nodo._sd = hijo = arbol._propio(nodo._sd)
+                hijo._padre = arbol
+                if hijo.raiz is not None:
+                    pila.append(hijo)
+        return copia
+
+    def snapshot(self) -> "ArbolBinario[T]":
+        """Devuelve en O(1) una foto del árbol que no cambia al modificar el original (ni viceversa).
+
+        La primera foto de un árbol marca una sola vez sus subárboles como compartidos, en O(n).
+        """
+        if self._padre is not None:
+            raise ValueError("Solo se puede tomar una foto de la raíz del árbol")
+        compartido = self._es_compartido()
+        if not compartido and self._version is None:
+            self._sellar(_Version(viva=False))
+        elif not compartido:
+            self._version.viva = False
+        foto = type(self)()
+        if self.raiz is not None:
+            foto.raiz = self.raiz._copia()
+        # Ambos estrenan versión: los subárboles anteriores quedan compartidos y se copian al
+        # modificarlos (uno que ya era compartido sigue siéndolo, y se sigue sin poder modificar)
+        foto._version = _Version()
+        if not compartido:
+            self._version = _Version()
+        return foto
+
+    def restaurar(self, foto: "ArbolBinario[T]"):
+        """Vuelve el árbol, en O(1), al contenido de una foto tomada con snapshot()."""
+        if self._padre is not None:
+            raise ValueError("Solo se puede restaurar la raíz del árbol")
+        self._validar_version()
+        # Otra foto de la foto: su contenido queda compartido y se toma su raíz, que es una copia
+        copia = foto.snapshot()
+        if self._version is not None:
+            self._version.viva = False # Los subárboles que se descartan ya no se modifican
+        self.raiz = copia.raiz
+        self._niveles = None
+        self._version = _Version()
+
     # Método para verificar si el nodo es una hoja (sin hijos)
     def es_hoja(self) -> bool:
         # verifica que el nodo tenga una raiz y que no tenga subarboles izquierdo y derecho
-        return not self.es_vacio() and self.si().es_vacio() and self.sd().es_vacio()
+        return self.raiz is not None and self.raiz._si.raiz is None and self.raiz._sd.raiz is None
 
     @_Decoradores.valida_es_vacio # Aplica el decorador para validar si el árbol está vacío (si no tiene raiz)
     def dato(self) -> T:
@@ -71,101 +277,385 @@ class ArbolBinario(Generic[T]):
     @_Decoradores.valida_es_vacio # Aplica el decorador para validar si el árbol está vacío (si no tiene raiz)
     def insertar_si(self, si: "ArbolBinario[T]"):
         assert self.raiz is not None  # Asegura que la raíz no sea None
-        self.raiz.si = si  # Asigna un nuevo subárbol izquierdo
+        self._validar_version()
+        self._validar_suelto(si, self.raiz._sd)
+        self._soltar(self.raiz._si)
+        si = self._injertable(si)
+        self.raiz._si = si  # Asigna un nuevo subárbol izquierdo
+        si._padre = self
+        self._propagar()
 
     @_Decoradores.valida_es_vacio # Aplica el decorador para validar si el árbol está vacío (si no tiene raiz)
     def insertar_sd(self, sd: "ArbolBinario[T]"):
         assert self.raiz is not None  # Asegura que la raíz no sea None
-        self.raiz.sd = sd  # Asigna un nuevo subárbol derecho
+        self._validar_version()
+        self._validar_suelto(sd, self.raiz._si)
+        self._soltar(self.raiz._sd)
+        sd = self._injertable(sd)
+        self.raiz._sd = sd  # Asigna un nuevo subárbol derecho
+        sd._padre = self
+        self._propagar()
     
     # Método para establecer la raíz del árbol con un nodo dado
-    def set_raiz(self, nodo: NodoAB[T]):
+    def set_raiz(self, nodo: Optional[NodoAB[T]]):
+        self._validar_version()
+        if nodo is not None:
+            self._validar_suelto(nodo._si, nodo._sd)
+            self._validar_suelto(nodo._sd)
+            si = nodo._si if nodo._si._es_compartido() else self._injertable(nodo._si)
+            sd = nodo._sd if nodo._sd._es_compartido() else self._injertable(nodo._sd)
+            if si is not nodo._si or sd is not nodo._sd:
+                # Un hijo de otro árbol con fotos se injerta copiado, sin tocar el nodo recibido
+                nodo = nodo._copia()
+                nodo._si = si
+                nodo._sd = sd
+        if self.raiz is not None and self.raiz is not nodo:
+            self._soltar(self.raiz._si)
+            self._soltar(self.raiz._sd)
+        self._poner_raiz(nodo)
+
+    # La aumentación se propaga por un único _padre: un subárbol no puede colgar de dos árboles a la
+    # vez (uno quedaría con len()/altura() viejos). Uno compartido con una foto, o propio de otro
+    # árbol con fotos, sí, porque se injerta una copia
+    def _validar_suelto(self, arbol: "ArbolBinario[T]", hermano: "Optional[ArbolBinario[T]]" = None):
+        if arbol._es_compartido() or (arbol._version is not self._version and arbol._version is not None):
+            return
+        padre = arbol._padre
+        if padre is not None and padre is not self:
+            raise ValueError("El subárbol ya cuelga de otro árbol: hay que sacarlo de ahí o insertar una copia")
+        if arbol is hermano:
+            raise ValueError("El subárbol ya cuelga del otro lado de este nodo")
+        # Colgar un árbol de sí mismo o de un descendiente armaría un ciclo. Fuera de sí mismo, solo
+        # puede ser ancestro una raíz con hijos (si colgara de otro ya se rechazó): recién entonces se
+        # suben los ancestros, O(profundidad). Colgar hojas, como al armar de arriba hacia abajo, es O(1)
+        if arbol is self:
+            raise ValueError("Un árbol no puede colgar de sí mismo")
+        if padre is None and arbol.raiz is not None and (arbol.raiz._si.raiz is not None or arbol.raiz._sd.raiz is not None):
+            ancestro = self._padre
+            while ancestro is not None:
+                if ancestro is arbol:
+                    raise ValueError("Un árbol no puede colgar de uno de sus descendientes")
+                ancestro = ancestro._padre
+
+    def _soltar(self, hijo: "ArbolBinario[T]"):
+        # El subárbol reemplazado deja de colgar de este árbol y se puede injertar en otro
+        if hijo is not _VACIO and hijo._padre is self:
+            hijo._padre = None
+
+    # Sin validar la versión: para los algoritmos que llegan al subárbol por _izquierdo/_derecho
+    def _poner_raiz(self, nodo: Optional[NodoAB[T]]):
         self.raiz = nodo
+        self._enlazar()
+        self._propagar()
+
+    # Aumentación: cada nodo guarda la cantidad de nodos y la altura de su subárbol.
+    # Modificar el árbol con insertar_si, insertar_sd o set_raiz solo la marca como pendiente
+    # (altura 0) en el subárbol y en los ancestros que todavía no lo estaban: O(1) amortizado,
+    # también al armar un árbol colgando nodos de arriba hacia abajo. Al consultarla se
+    # recalculan solo los nodos pendientes; sin cambios en el medio, len() y altura() son O(1).
+    def _cantidad(self) -> int:
+        nodo = self.raiz
+        if nodo is None:
+            return 0
+        if nodo.altura == 0:
+            self._recalcular()
+        return nodo.cantidad
+
+    def _altura(self) -> int:
+        nodo = self.raiz
+        if nodo is None:
+            return 0
+        if nodo.altura == 0:
+            self._recalcular()
+        return nodo.altura
+
+    def _recalcular(self):
+        # Recalcula de abajo hacia arriba los nodos pendientes; los demás ya están al día, y
+        # también sus descendientes (un pendiente tiene pendientes a todos sus ancestros)
+        assert self.raiz is not None
+        pila = [self.raiz]
+        while pila:
+            nodo = pila[-1]
+            si = nodo._si.raiz
+            sd = nodo._sd.raiz
+            if si is not None and si.altura == 0:
+                pila.append(si)
+            elif sd is not None and sd.altura == 0:
+                pila.append(sd)
+            else:
+                pila.pop()
+                nodo.cantidad = 1 + (0 if si is None else si.cantidad) + (0 if sd is None else sd.cantidad)
+                nodo.altura = 1 + max(0 if si is None else si.altura, 0 if sd is None else sd.altura)
+
+    def _enlazar(self):
+        # Los subárboles de la raíz pasan a tener a este árbol como padre
+        if self.raiz is not None:
+            if self.raiz._si is not _VACIO:
+                self.raiz._si._padre = self
+            if self.raiz._sd is not _VACIO:
+                self.raiz._sd._padre = self
+
+    def _actualizar(self):
+        # Recalcula la aumentación de la raíz a partir de sus hijos (las rotaciones la necesitan al día)
+        nodo = self.raiz
+        if nodo is not None:
+            nodo.cantidad = 1 + nodo._si._cantidad() + nodo._sd._cantidad()
+            nodo.altura = 1 + max(nodo._si._altura(), nodo._sd._altura())
+
+    def _propagar(self):
+        # Marca pendientes a este subárbol (su raíz puede ser nueva) y a sus ancestros, hasta el
+        # primero que ya lo estaba: los de más arriba también lo están y no tienen índice de niveles,
+        # porque indexar_niveles() recalcula antes de armarlo
+        self._niveles = None
+        if self.raiz is not None:
+            self.raiz.altura = 0
+        arbol = self._padre
+        while arbol is not None:
+            arbol._niveles = None
+            nodo = arbol.raiz
+            if nodo is not None:
+                if nodo.altura == 0:
+                    break
+                nodo.altura = 0
+            arbol = arbol._padre
+
+    def es_consistente(self) -> bool:
+        """Verifica en O(n) que la aumentación y los enlaces al padre coincidan con la estructura (para depuración)."""
+        if self.raiz is not None and not self._hijos_enlazados():
+            return False
+        for nodo in self._nodos_posorder():
+            # En posorden los hijos ya fueron verificados antes que su padre. Un nodo pendiente se
+            # recalcula al consultarlo; uno al día tiene que coincidir con sus hijos, también al día
+            if nodo.altura != 0:
+                if any(hijo.raiz is not None and hijo.raiz.altura == 0 for hijo in (nodo._si, nodo._sd)):
+                    return False
+                if nodo.cantidad != 1 + nodo._si._cantidad() + nodo._sd._cantidad():
+                    return False
+                if nodo.altura != 1 + max(nodo._si._altura(), nodo._sd._altura()):
+                    return False
+            for hijo in (nodo._si, nodo._sd):
+                # Los enlaces al padre de los subárboles compartidos con una foto no se usan
+                if hijo.raiz is not None and not hijo._es_compartido() and not hijo._hijos_enlazados():
+                    return False
+        return True
+
+    def _hijos_enlazados(self) -> bool:
+        assert self.raiz is not None
+        # Un hijo compartido con una foto no está enlazado a ninguna en particular
+        return all(
+            hijo._padre is self or hijo._es_compartido()
+            for hijo in (self.raiz._si, self.raiz._sd)
+        )
+
+    def recalcular_aumentacion(self):
+        """Reconstruye en O(n) la aumentación y los enlaces al padre de todo el árbol."""
+        pila: list[ArbolBinario[T]] = [] if self.raiz is None else [self]
+        orden: list[ArbolBinario[T]] = []
+        while pila:
+            arbol = pila.pop()
+            orden.append(arbol)
+            arbol._enlazar()
+            assert arbol.raiz is not None
+            for hijo in (arbol.raiz._si, arbol.raiz._sd):
+                if hijo.raiz is not None:
+                    pila.append(hijo)
+        # Recorriendo al revés, cada subárbol se actualiza después de sus hijos
+        for arbol in reversed(orden):
+            arbol._actualizar()
+        self._propagar()
     
+    # Motor de recorridos: generadores iterativos (pila/cola explícita) que entregan los nodos
+    def _nodos_preorder(self) -> Iterator[NodoAB[T]]:
+        pila = [] if self.raiz is None else [self.raiz]
+        while pila:
+            nodo = pila.pop()
+            yield nodo
+            if nodo._sd.raiz is not None:
+                pila.append(nodo._sd.raiz)
+            if nodo._si.raiz is not None:
+                pila.append(nodo._si.raiz)
+
+    def _nodos_inorder(self) -> Iterator[NodoAB[T]]:
+        pila: list[NodoAB[T]] = []
+        nodo = self.raiz
+        while pila or nodo is not None:
+            while nodo is not None:
+                pila.append(nodo)
+                nodo = nodo._si.raiz
+            nodo = pila.pop()
+            yield nodo
+            nodo = nodo._sd.raiz
+
+    def _nodos_posorder(self) -> Iterator[NodoAB[T]]:
+        pila: list[NodoAB[T]] = []
+        ultimo: Optional[NodoAB[T]] = None
+        nodo = self.raiz
+        while pila or nodo is not None:
+            while nodo is not None:
+                pila.append(nodo)
+                nodo = nodo._si.raiz
+            tope = pila[-1]
+            derecho = tope._sd.raiz
+            if derecho is not None and derecho is not ultimo:
+                nodo = derecho  # Falta recorrer el subárbol derecho
+            else:
+                ultimo = pila.pop()
+                yield ultimo
+
+    def _nodos_bfs(self) -> Iterator[tuple[NodoAB[T], int]]:
+        # Entrega cada nodo junto con su nivel (la raíz está en el nivel 1)
+        cola = deque() if self.raiz is None else deque([(self.raiz, 1)])
+        while cola:
+            nodo, nivel = cola.popleft()
+            yield nodo, nivel
+            if nodo._si.raiz is not None:
+                cola.append((nodo._si.raiz, nivel + 1))
+            if nodo._sd.raiz is not None:
+                cola.append((nodo._sd.raiz, nivel + 1))
+
+    def iter_inorder(self) -> Iterator[T]:
+        return (nodo.dato for nodo in self._nodos_inorder())
+
+    def iter_preorder(self) -> Iterator[T]:
+        return (nodo.dato for nodo in self._nodos_preorder())
+
+    def iter_posorder(self) -> Iterator[T]:
+        return (nodo.dato for nodo in self._nodos_posorder())
+
+    def iter_bfs_con_nivel(self) -> Iterator[tuple[T, int]]:
+        # (dato, nivel) por niveles; al ser un generador, cortar el recorrido no visita el resto
+        return ((nodo.dato, nivel) for nodo, nivel in self._nodos_bfs())
+
+    def iter_bfs(self) -> Iterator[T]:
+        return (nodo.dato for nodo, _ in self._nodos_bfs())
+
+    def __iter__(self) -> Iterator[T]:
+        return self.iter_inorder()
+
     # Método para calcular la altura del árbol (número de niveles)
     def altura(self) -> int:
-        if self.es_vacio():
-            return 0 # La altura de un árbol vacío es 0
-        else:
-            return 1 + max(self.si().altura(), self.sd().altura()) # Altura = 1 + altura del subárbol más alto
+        return self._altura() # Se lee de la aumentación de la raíz (0 si está vacío)
     
     # Método especial para obtener la cantidad de nodos en el árbol (longitud)
     def __len__(self) -> int:
-        if self.es_vacio():
-            return 0 # Si está vacío, retorna longitud 0
-        else:
-            return 1 + len(self.si()) + len(self.sd()) # Cuenta los nodos en los subárboles y el de la raiz
+        return self._cantidad() # Se lee de la aumentación de la raíz (0 si está vacío)
     
-    def __str__(self):
-        def mostrar(t: ArbolBinario[T], nivel: int):
-            tab = '.' * 4
+    def _lineas(self) -> Iterator[str]:
+        # Texto indentado en preorden, una línea por subárbol (AV si está vacío); la pila es O(altura)
+        tab = '.' * 4
+        pila: list[tuple[ArbolBinario[T], int]] = [(self, 0)]
+        while pila:
+            t, nivel = pila.pop()
             indent = tab * nivel
-            if t.es_vacio():
-                return indent + 'AV\n'
+            if t.raiz is None:
+                yield indent + 'AV\n'
             else:
-                out = indent + str(t.dato()) + '\n'
-                out += mostrar(t.si(), nivel + 1)
-                out += mostrar(t.sd(), nivel + 1)
-                return out   
-        return mostrar(self, 0)
+                yield indent + str(t.raiz.dato) + '\n'
+                pila.append((t.raiz._sd, nivel + 1))
+                pila.append((t.raiz._si, nivel + 1))
+
+    def __str__(self):
+        return ''.join(self._lineas())
+
+    # Exportación a un archivo de texto abierto (ver exportar): se escribe de a bloques, en O(n)
+    def escribir(self, archivo: TextIO):
+        """Escribe el mismo texto indentado que str(), sin armarlo entero en memoria."""
+        exportar.escribir_lineas(archivo, self._lineas())
+
+    def escribir_dot(self, archivo: TextIO):
+        """Escribe el árbol en formato DOT de Graphviz; cada nodo es n<número> (n0 es la raíz) con su dato como etiqueta."""
+        exportar.escribir_lineas(archivo, self._lineas_dot())
+
+    def _lineas_dot(self) -> Iterator[str]:
+        # ordering=out mantiene al hijo izquierdo a la izquierda del derecho al dibujar
+        yield 'digraph arbol {\n  ordering=out;\n'
+        pila: list[tuple[NodoAB[T], int]] = [] if self.raiz is None else [(self.raiz, 0)]
+        siguiente = 1
+        while pila:
+            nodo, numero = pila.pop()
+            yield f'  n{numero} [label={exportar.id_dot(nodo.dato)}];\n'
+            hijos = []
+            for hijo in (nodo._si.raiz, nodo._sd.raiz):
+                if hijo is not None:
+                    yield f'  n{numero} -> n{siguiente};\n'
+                    hijos.append((hijo, siguiente))
+                    siguiente += 1
+            pila.extend(reversed(hijos))
+        yield '}\n'
 
     def inorder(self) -> list[T]:
-        if self.es_vacio():
-            return []
-        else:
-            return self.si().inorder() + [self.dato()] + self.sd().inorder()
+        return list(self.iter_inorder())
     
     def inorder_tail(self) -> list[T]:
-        pass
+        # Versión con acumulador: se agrega cada dato al final a medida que se visita
+        acumulador: list[T] = []
+        for nodo in self._nodos_inorder():
+            acumulador.append(nodo.dato)
+        return acumulador
 
     def preorder(self) -> list[T]:
-        pass
+        return list(self.iter_preorder())
 
     def posorder(self) -> list[T]:
-        pass
+        return list(self.iter_posorder())
 
     def bfs(self) -> list[T]:
-        """Devuelve los nodos organizados por niveles en una sola lista usando BFS recursivo."""
-        def recorrer(arbol: ArbolBinario[T], nivel = 0, diccionario = {}):
-            if arbol.es_vacio():
-                return
-            if not arbol.es_vacio():
-                if nivel in diccionario:
-                    diccionario[nivel].append(arbol.dato())
-                else:
-                    diccionario[nivel] = [arbol.dato()]
-                recorrer(arbol.si(), nivel + 1, diccionario)
-                recorrer(arbol.sd(), nivel + 1, diccionario)
-                           
-        niveles = {}
-        recorrer(self, 1, niveles)
-        return [valor for lista in niveles.values() for valor in lista]
+        """Devuelve los nodos organizados por niveles en una sola lista usando BFS con una cola."""
+        return list(self.iter_bfs())
 
     def nivel(self, x: T) -> int:
         """Dado un valor, regrese el nivel en el que se encuentra en caso de no encontrar debe retornar un valor superior ala altura del arbol."""
-        def recorrer(arbol: ArbolBinario[T], nivel = 0, diccionario = {}):
-            if arbol.es_vacio():
-                return
-            if not arbol.es_vacio():
-                if arbol.dato() == x:
-                    diccionario["existe"] = nivel
-                    return
-                else:
-                    diccionario["no existe"] = nivel + 2
-                recorrer(arbol.si(), nivel + 1, diccionario)
-                recorrer(arbol.sd(), nivel + 1, diccionario)
-                           
-        busqueda = {}
-        recorrer(self, 1, busqueda)
-        return busqueda['existe'] if "existe" in busqueda else busqueda["no existe"]
+        # Si el valor se repite, el nivel de la aparición menos profunda (la raíz está en el nivel 1)
+        if self._niveles is not None:
+            return self._niveles.get(x, self.altura() + 1)
+        # Sin índice: recorrido por niveles que termina apenas lo encuentra
+        for nodo, nivel in self._nodos_bfs():
+            if nodo.dato == x:
+                return nivel
+        return self.altura() + 1
+
+    def niveles(self, valores: Iterable[T]) -> dict[T, int]:
+        """Nivel de cada valor (altura + 1 si no está) con un solo recorrido, que termina al encontrarlos a todos."""
+        faltantes = set(valores)
+        no_esta = self.altura() + 1
+        if self._niveles is not None:
+            return {valor: self._niveles.get(valor, no_esta) for valor in faltantes}
+        resultado: dict[T, int] = {}
+        for nodo, nivel in self._nodos_bfs():
+            if not faltantes:
+                break
+            if nodo.dato in faltantes:
+                faltantes.remove(nodo.dato)
+                resultado[nodo.dato] = nivel
+        resultado.update(dict.fromkeys(faltantes, no_esta))
+        return resultado
+
+    def indexar_niveles(self):
+        """Arma en O(n) un índice dato -> nivel para que nivel() sea O(1); lo descarta cualquier modificación del árbol."""
+        self._cantidad() # Con la aumentación al día, la próxima modificación llega hasta este subárbol
+        indice: dict[T, int] = {}
+        for nodo, nivel in self._nodos_bfs():
+            # Por niveles, la primera aparición de un dato repetido es la menos profunda
+            indice.setdefault(nodo.dato, nivel)
+        self._niveles = indice
+
     def copy(self) -> "ArbolBinario[T]":
-        if self.es_vacio():
-            return ArbolBinario()
-        else:
-            arbol = ArbolBinario.crear_nodo(copy(self.dato()))
-            arbol.insertar_si(self.si().copy())
-            arbol.insertar_sd(self.sd().copy())
-            return arbol
+        arbol: ArbolBinario[T] = ArbolBinario()
+        pila = [] if self.raiz is None else [(self.raiz, arbol)]
+        while pila:
+            nodo, destino = pila.pop()
+            # La copia tiene la misma forma: se reutiliza la aumentación sin propagarla
+            destino.raiz = nuevo = NodoAB(copy(nodo.dato))
+            nuevo.cantidad = nodo.cantidad
+            nuevo.altura = nodo.altura
+            if nodo._si.raiz is not None:
+                nuevo._si = ArbolBinario()
+                pila.append((nodo._si.raiz, nuevo._si))
+            if nodo._sd.raiz is not None:
+                nuevo._sd = ArbolBinario()
+                pila.append((nodo._sd.raiz, nuevo._sd))
+            destino._enlazar()
+        return arbol
 
     def espejo(self) -> "ArbolBinario[T]":
         pass
@@ -173,17 +663,56 @@ class ArbolBinario(Generic[T]):
     def sin_hojas(self):
         pass
 
-    def graficar_arbol(self):
-        def arbol_a_diccionario(arbol: ArbolBinario[T]) -> Optional[dict]:
-            if arbol.es_vacio():
-                return None
-            return {
-                'value': arbol.dato(),
-                'left': arbol_a_diccionario(arbol.si()),
-                'right': arbol_a_diccionario(arbol.sd())
-            }
-        binary_tree = arbol_a_diccionario(self) #Obtengo el diccionario
-        grafico_arbol_binario(binary_tree)
+    # Serialización binaria (ver serializacion_arbol): una sola pasada iterativa, escrita y leída de a bloques
+    def guardar(self, archivo: BinaryIO):
+        """Escribe el árbol, con su forma exacta, en un archivo binario abierto (por ejemplo open(ruta, 'wb'))."""
+        serializacion_arbol.escribir(archivo, serializacion_arbol.FORMA, (
+            (nodo.dato, (nodo._si.raiz is not None) | (nodo._sd.raiz is not None) << 1)
+            for nodo in self._nodos_preorder()
+        ))
+
+    @classmethod
+    def cargar(cls, archivo: BinaryIO) -> "ArbolBinario[T]":
+        """Lee un árbol escrito por guardar() de un archivo binario abierto (por ejemplo open(ruta, 'rb'))."""
+        tipo, bloques = serializacion_arbol.leer(archivo)
+        if tipo != serializacion_arbol.FORMA:
+            raise ValueError("El archivo guarda solo las claves: se carga con ArbolBinarioOrdenado.cargar")
+        return cls._desde_preorden(chain.from_iterable(zip(datos, hijos) for datos, hijos in bloques))
+
+    @classmethod
+    def _desde_preorden(cls, nodos: Iterator[tuple[T, int]]) -> "ArbolBinario[T]":
+        arbol = cls()
+        # hueco es el subárbol vacío que recibe el próximo nodo del preorden; pendientes, los
+        # subárboles derechos que quedaron por completar (el último es el próximo a usar)
+        hueco: Optional[ArbolBinario[T]] = arbol
+        pendientes: list[ArbolBinario[T]] = []
+        orden: list[ArbolBinario[T]] = []
+        for dato, hijos in nodos:
+            if hueco is None:
+                raise ValueError("El archivo del árbol está dañado: sobran nodos")
+            hueco.raiz = nodo = arbol._nodo_nuevo(dato)
+            orden.append(hueco)
+            if hijos & serializacion_arbol.DERECHO:
+                nodo._sd = nodo._arbol_vacio()
+                pendientes.append(nodo._sd)
+            if hijos & serializacion_arbol.IZQUIERDO:
+                nodo._si = hueco = nodo._arbol_vacio()
+            else:
+                hueco = pendientes.pop() if pendientes else None
+        if pendientes or (orden and hueco is not None):
+            raise ValueError("El archivo del árbol está dañado: faltan nodos")
+        # Al revés del preorden cada subárbol se actualiza después de sus hijos
+        for subarbol in reversed(orden):
+            subarbol._enlazar()
+            subarbol._actualizar()
+        return arbol
+
+    def graficar_arbol(self, archivo: Optional[str] = None):
+        # La disposición se calcula directamente sobre los nodos, sin copiar el árbol
+        grafico_arbol_binario(self.raiz, lambda nodo: (nodo._si.raiz, nodo._sd.raiz), lambda nodo: nodo.dato, archivo)
+
+# Centinela compartido por todos los subárboles vacíos que todavía nadie pidió: no se modifica nunca
+_VACIO: ArbolBinario = ArbolBinario()
 
 def main():
     t = ArbolBinario.crear_nodo(1)
@@ -208,6 +737,8 @@ def main():
     print(f'Nodos: {len(t)}')
     print(f'BFS: {t.bfs()}')
     print(f'Nivel de 8: {t.nivel(8)}')
+    t.indexar_niveles()
+    print(f'Niveles de 3, 8 y 9: {t.niveles([3, 8, 9])}')
     t2 = t.copy()
     #print(t2)
     t2.graficar_arbol()
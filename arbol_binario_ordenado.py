@@ -1,5 +1,10 @@
-from typing import TypeVar, Optional, Protocol
+import heapq
+from collections.abc import Iterable, Iterator
+from itertools import chain, islice
+from operator import lt
+from typing import BinaryIO, TypeVar, Optional, Protocol
 from arbol_binario import ArbolBinario, NodoAB
+import serializacion_arbol
 
 class Comparable(Protocol):
     def __lt__(self: 'T', otro: 'T') -> bool: ...
@@ -13,8 +18,13 @@ T = TypeVar('T', bound=Comparable)
 
 
 class NodoABO(NodoAB[T]):
+    __slots__ = ()
+
     def __init__(self, dato: T):
-        super().__init__(dato, ArbolBinarioOrdenado(), ArbolBinarioOrdenado())
+        super().__init__(dato)
+
+    def _arbol_vacio(self) -> "ArbolBinarioOrdenado[T]":
+        return ArbolBinarioOrdenado()
     
     def __lt__(self, otro: "NodoABO[T]") -> bool:
         return isinstance(otro, NodoABO) and self.dato < otro.dato
@@ -27,6 +37,8 @@ class NodoABO(NodoAB[T]):
     
     
 class ArbolBinarioOrdenado(ArbolBinario[T]):
+    __slots__ = ()
+
     @staticmethod
     def crear_nodo(dato: T) -> "ArbolBinarioOrdenado[T]":
         nuevo = ArbolBinarioOrdenado()
@@ -34,91 +46,240 @@ class ArbolBinarioOrdenado(ArbolBinario[T]):
         return nuevo
     
     def es_ordenado(self) -> bool:
-        def es_ordenado_interna(
-            arbol: "ArbolBinarioOrdenado[T]", 
-            minimo: Optional[T] = None, 
-            maximo: Optional[T] = None
-        ) -> bool:
-            if arbol.es_vacio():
-                return True
-            if (minimo is not None and arbol.dato() <= minimo) or (maximo is not None and arbol.dato() >= maximo):
+        return self._es_ordenado_entre(None, None)
+
+    def _es_ordenado_entre(self, minimo: Optional[T], maximo: Optional[T]) -> bool:
+        # Verifica iterativamente el orden estricto y que todos los datos estén entre las cotas (None = sin cota)
+        pila: list[tuple[NodoAB[T], Optional[T], Optional[T]]] = [] if self.raiz is None else [(self.raiz, minimo, maximo)]
+        while pila:
+            nodo, minimo, maximo = pila.pop()
+            if (minimo is not None and nodo.dato <= minimo) or (maximo is not None and nodo.dato >= maximo):
                 return False
-            return es_ordenado_interna(arbol.si(), minimo, arbol.dato()) and es_ordenado_interna(arbol.sd(), arbol.dato(), maximo)
-        
-        return es_ordenado_interna(self)
-    
+            if nodo._si.raiz is not None:
+                pila.append((nodo._si.raiz, minimo, nodo.dato))
+            if nodo._sd.raiz is not None:
+                pila.append((nodo._sd.raiz, nodo.dato, maximo))
+        return True
+
+    def _cotas(self) -> tuple[Optional[T], Optional[T]]:
+        # Cotas que imponen los ancestros a este subárbol: el primero del que cuelga por la
+        # derecha da el mínimo y el primero del que cuelga por la izquierda da el máximo
+        minimo: Optional[T] = None
+        maximo: Optional[T] = None
+        hijo: ArbolBinario[T] = self
+        padre = self._padre
+        while padre is not None and padre.raiz is not None and (minimo is None or maximo is None):
+            if padre.raiz._si is hijo:
+                maximo = padre.raiz.dato if maximo is None else maximo
+            elif padre.raiz._sd is hijo:
+                minimo = padre.raiz.dato if minimo is None else minimo
+            else:
+                break # Enlace desactualizado: este subárbol ya no cuelga de ese padre
+            hijo, padre = padre, padre._padre
+        return minimo, maximo
+
+    # Solo se valida el subárbol injertado contra las cotas de su punto de inserción: O(len(arbol) + altura)
     def insertar_si(self, arbol: "ArbolBinarioOrdenado[T]"):
-        si = self.si()
-        super().insertar_si(arbol)
-        if not self.es_ordenado():
-            super().insertar_si(si)
+        minimo, _ = self._cotas()
+        if not arbol._es_ordenado_entre(minimo, self.dato()):
             raise ValueError("El árbol a insertar no es ordenado o viola la propiedad de orden del árbol actual")
+        super().insertar_si(arbol)
     
     def insertar_sd(self, arbol: "ArbolBinarioOrdenado[T]"):
-        sd = self.sd()
-        super().insertar_sd(arbol)
-        if not self.es_ordenado():
-            super().insertar_sd(sd)
+        _, maximo = self._cotas()
+        if not arbol._es_ordenado_entre(self.dato(), maximo):
             raise ValueError("El árbol a insertar no es ordenado o viola la propiedad de orden del árbol actual")
+        super().insertar_sd(arbol)
     
+    # Crea el nodo que se cuelga al insertar un valor (las subclases lo redefinen)
+    def _nodo_nuevo(self, valor: T) -> NodoABO[T]:
+        return NodoABO(valor)
+
+    # Se llama con el camino de subárboles (de la raíz hacia abajo) que tocó una modificación
+    def _despues_de_modificar(self, camino: "list[ArbolBinarioOrdenado[T]]"):
+        pass
+
     def insertar(self, valor: T):
-        if self.es_vacio():
-            self.set_raiz(NodoABO(valor))
-        elif valor < self.dato():
-            self.si().insertar(valor)
-        else:
-            self.sd().insertar(valor)
-    def graficar_arbol(self):
-        return super().graficar_arbol()
+        # Descenso iterativo por los campos del nodo, sin pasar por los accesores validados
+        # (en un árbol con fotos, _izquierdo/_derecho copian el camino que se modifica)
+        self._validar_version()
+        camino: list[ArbolBinarioOrdenado[T]] = []
+        actual = self
+        while actual.raiz is not None:
+            camino.append(actual)
+            actual = actual._izquierdo() if valor < actual.raiz.dato else actual._derecho()
+        actual._poner_raiz(self._nodo_nuevo(valor))
+        camino.append(actual)
+        self._despues_de_modificar(camino)
+
+    def eliminar(self, valor: T):
+        if not self.pertenece(valor):
+            raise ValueError("No existe el valor a eliminar")
+        self._validar_version()
+        camino: list[ArbolBinarioOrdenado[T]] = []
+        actual = self
+        while actual.raiz.dato != valor:
+            camino.append(actual)
+            actual = actual._izquierdo() if valor < actual.raiz.dato else actual._derecho()
+        camino.append(actual)
+        nodo = actual.raiz
+        if nodo._si.raiz is not None and nodo._sd.raiz is not None:
+            # Dos hijos: se reemplaza el dato por el del sucesor y se elimina el sucesor
+            sucesor = actual._derecho()
+            camino.append(sucesor)
+            while sucesor.raiz._si.raiz is not None:
+                sucesor = sucesor._izquierdo()
+                camino.append(sucesor)
+            nodo.dato = sucesor.raiz.dato
+            actual = sucesor
+        # A lo sumo un hijo: el subárbol pasa a tener como raíz la de ese hijo
+        hijo = actual._derecho() if actual.raiz._si.raiz is None else actual._izquierdo()
+        actual._poner_raiz(hijo.raiz)
+        self._despues_de_modificar(camino)
+
+    # Formato de claves: solo los datos en inorden. Al cargar se arma un árbol balanceado en O(n) con
+    # desde_ordenados, sin guardar la forma; un archivo con forma (de ArbolBinario.guardar) también se acepta
+    def guardar(self, archivo: BinaryIO):
+        """Escribe los valores ordenados en un archivo binario abierto (por ejemplo open(ruta, 'wb'))."""
+        serializacion_arbol.escribir(
+            archivo, serializacion_arbol.CLAVES, ((nodo.dato, 0) for nodo in self._nodos_inorder())
+        )
+
+    @classmethod
+    def cargar(cls, archivo: BinaryIO) -> "ArbolBinarioOrdenado[T]":
+        """Lee un árbol escrito por guardar(), balanceado, de un archivo binario abierto."""
+        tipo, bloques = serializacion_arbol.leer(archivo)
+        if tipo == serializacion_arbol.CLAVES:
+            return cls.desde_ordenados(chain.from_iterable(datos for datos, _ in bloques))
+        arbol = cls._desde_preorden(chain.from_iterable(zip(datos, hijos) for datos, hijos in bloques))
+        if not arbol.es_ordenado():
+            raise ValueError("El árbol del archivo no es ordenado")
+        return arbol
+
+    def graficar_arbol(self, archivo: Optional[str] = None):
+        return super().graficar_arbol(archivo)
+
     def pertenece(self, valor: T) -> bool:
-        if self.es_vacio():
-            return False
-        else:
-            if self.dato() == valor:
+        nodo = self.raiz
+        while nodo is not None:
+            if nodo.dato == valor:
                 return True
-            
-            if self.dato() < valor:
-                return self.sd().pertenece(valor)
-            else:
-                return self.si().pertenece(valor)
+            nodo = nodo._sd.raiz if nodo.dato < valor else nodo._si.raiz
+        return False
+
     def minimo(self) -> Optional[T]:
-        if self.es_vacio():
+        nodo = self.raiz
+        if nodo is None:
             return None
-        else:
-            dato = self.dato()
-            if self.es_hoja():
-                return dato
-            if self.si():
-                return self.si().minimo()
-                    
+        while nodo._si.raiz is not None:
+            nodo = nodo._si.raiz
+        return nodo.dato
+
     def maximo(self) -> Optional[T]:
-            if self.es_vacio():
-                return None
+        nodo = self.raiz
+        if nodo is None:
+            return None
+        while nodo._sd.raiz is not None:
+            nodo = nodo._sd.raiz
+        return nodo.dato
+
+    def valores_menores_a(self, valor: T) -> Iterator[T]:
+        # Inorden que se detiene en el primer dato >= valor: nunca entra a un subárbol derecho sin coincidencias
+        pila: list[NodoAB[T]] = []
+        nodo = self.raiz
+        while pila or nodo is not None:
+            while nodo is not None:
+                pila.append(nodo)
+                nodo = nodo._si.raiz
+            nodo = pila.pop()
+            if not nodo.dato < valor:
+                return
+            yield nodo.dato
+            nodo = nodo._sd.raiz
+
+    # Estadísticos de orden: usan la cantidad de nodos guardada en cada nodo, O(altura)
+    def contar_menores_a(self, valor: T) -> int:
+        cantidad = 0
+        nodo = self.raiz
+        while nodo is not None:
+            if nodo.dato < valor:
+                cantidad += nodo._si._cantidad() + 1 # El nodo y todo su subárbol izquierdo son menores
+                nodo = nodo._sd.raiz
             else:
-                dato = self.dato()
-                if self.es_hoja():
-                    return dato
-                if self.sd():
-                    return self.sd().maximo() 
-    def valores_menores_a(self, valor: T) -> list[T]:
-        def recorrer(a: ArbolBinario[T], lista = []):
-            if a.es_vacio():
-                return []
+                nodo = nodo._si.raiz
+        return cantidad
+
+    def rango(self, valor: T) -> int:
+        """Devuelve la posición (desde 1) de valor en el orden del árbol."""
+        cantidad = 0
+        encontrado = False
+        nodo = self.raiz
+        while nodo is not None:
+            if nodo.dato < valor:
+                cantidad += nodo._si._cantidad() + 1
+                nodo = nodo._sd.raiz
             else:
-                if a.dato() < valor:
-                    lista.append(a.dato())
-                if a.si():
-                    recorrer(a.si(), lista)
-                if a.sd():
-                    recorrer(a.sd(), lista)
-        lista = []
-        recorrer(self, lista)
-        return lista
+                encontrado = encontrado or nodo.dato == valor
+                nodo = nodo._si.raiz
+        if not encontrado:
+            raise ValueError("No existe el valor en el árbol")
+        return cantidad + 1
+
+    def k_esimo(self, k: int) -> T:
+        """Devuelve el k-ésimo menor valor del árbol (k desde 1)."""
+        if not 1 <= k <= len(self):
+            raise ValueError("k fuera de rango")
+        nodo = self.raiz
+        while nodo is not None:
+            izquierdo = nodo._si._cantidad()
+            if k <= izquierdo:
+                nodo = nodo._si.raiz
+            elif k == izquierdo + 1:
+                return nodo.dato
+            else:
+                k -= izquierdo + 1
+                nodo = nodo._sd.raiz
+        raise ValueError("k fuera de rango")
             
+    # Construcción masiva: arma un árbol perfectamente balanceado en O(n) sin pasar por insertar
+    @classmethod
+    def desde_ordenados(cls, valores: Iterable[T]) -> "ArbolBinarioOrdenado[T]":
+        datos = list(valores)
+        if any(map(lt, islice(datos, 1, None), datos)):
+            raise ValueError("Los valores no están ordenados")
+        arbol = cls()
+        # Cada entrada es un subárbol vacío a completar con los datos[desde:hasta]
+        pila: list[tuple[ArbolBinarioOrdenado[T], int, int]] = [(arbol, 0, len(datos))] if datos else []
+        while pila:
+            destino, desde, hasta = pila.pop()
+            medio = (desde + hasta) // 2
+            nodo = arbol._nodo_nuevo(datos[medio])
+            # Con el medio como raíz, la aumentación se conoce sin recorrer los hijos
+            nodo.cantidad = hasta - desde
+            nodo.altura = (hasta - desde).bit_length()
+            destino.raiz = nodo
+            if desde < medio:
+                nodo._si = nodo._arbol_vacio()
+                pila.append((nodo._si, desde, medio))
+            if medio + 1 < hasta:
+                nodo._sd = nodo._arbol_vacio()
+                pila.append((nodo._sd, medio + 1, hasta))
+            destino._enlazar()
+        return arbol
+
+    @classmethod
+    def desde_iterable(cls, valores: Iterable[T]) -> "ArbolBinarioOrdenado[T]":
+        return cls.desde_ordenados(sorted(valores))
+
     @staticmethod
     def convertir_ordenado(arbol_binario: ArbolBinario[T]) -> "ArbolBinarioOrdenado[T]":
-        pass
-        
+        return ArbolBinarioOrdenado.desde_iterable(arbol_binario.iter_inorder())
+
+    @classmethod
+    def fusionar(cls, uno: "ArbolBinarioOrdenado[T]", otro: "ArbolBinarioOrdenado[T]") -> "ArbolBinarioOrdenado[T]":
+        """Devuelve un árbol balanceado con los valores de ambos árboles, en O(n + m)."""
+        return cls.desde_ordenados(heapq.merge(uno.iter_inorder(), otro.iter_inorder()))
+
 
 def main():
     t: ArbolBinarioOrdenado[int] = ArbolBinarioOrdenado()
@@ -145,7 +306,19 @@ def main():
     print(f'Tiene 12: {t.pertenece(12)}')
     print(f'minimo: {t.minimo()}')
     print(f'maximo: {t.maximo()}')
-    print(f'Valores menores a 13: {t.valores_menores_a(13)}')
+    print(f'Valores menores a 13: {list(t.valores_menores_a(13))}')
+    print(f'Menores a 13: {t.contar_menores_a(13)}')
+    print(f'Rango de 12: {t.rango(12)}')
+    print(f'3er menor: {t.k_esimo(3)}')
+    t3 = ArbolBinarioOrdenado.desde_iterable([9, 3, 1, 7, 5])
+    print(f'Fusionado: {ArbolBinarioOrdenado.fusionar(t, t3).inorder()}')
+    foto = t.snapshot()
+    t.insertar(30)
+    t.eliminar(12)
+    print(f'Modificado: {t.inorder()}')
+    print(f'Foto:       {foto.inorder()}')
+    t.restaurar(foto)
+    print(f'Restaurado: {t.inorder()}')
     """
     """
 
@@ -0,0 +1,34 @@
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from arbol_binario_ordenado import ArbolBinarioOrdenado
+
+REPETICIONES = 1_000_000
+
+
+def main():
+    arbol = ArbolBinarioOrdenado.desde_ordenados(range(3))
+    # Costo por llamada de los accesores validados frente al acceso interno a los campos del nodo
+    casos = [
+        ('dato() validado', lambda: arbol.dato()),
+        ('raiz.dato directo', lambda: arbol.raiz.dato),
+        ('si() validado', lambda: arbol.si()),
+        ('_izquierdo() interno', lambda: arbol._izquierdo()),
+        ('raiz._si directo', lambda: arbol.raiz._si),
+    ]
+    print(f'ns por llamada ({REPETICIONES} llamadas)')
+    for nombre, funcion in casos:
+        segundos = timeit.timeit(funcion, number=REPETICIONES)
+        print(f'{nombre:22} {segundos / REPETICIONES * 1e9:8.1f}')
+
+    grande = ArbolBinarioOrdenado.desde_ordenados(range(200_000))
+    valores = list(range(0, 200_000, 7))
+    segundos = timeit.timeit(lambda: [grande.pertenece(v) for v in valores], number=3)
+    print(f'pertenece x {len(valores)}: {segundos / 3 * 1e3:8.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from algoritmos_paralelos import cantidad_alcanzables_en_paralelo
+from grafo_adyacencia import GrafoAdyacencia
+
+NODOS = 200_000
+ARISTAS = 1_000_000
+ORIGENES = 64
+
+
+def main():
+    random.seed(0)
+    aristas = ((random.randrange(NODOS), random.randrange(NODOS)) for _ in range(ARISTAS))
+    foto = GrafoAdyacencia.desde_lista_aristas(aristas, nodos=range(NODOS), dirigido=True).freeze()
+    origenes = random.sample(range(NODOS), ORIGENES)
+
+    inicio = time.perf_counter()
+    esperado = {origen: len(foto.bfs_id(foto.index_nodo(origen))) for origen in origenes}
+    secuencial = time.perf_counter() - inicio
+    print(f'{ORIGENES} BFS sobre {NODOS} nodos y {ARISTAS} aristas (cpu_count = {os.cpu_count()})')
+    print(f'secuencial:  {secuencial:6.2f} s')
+    procesos = 1
+    while procesos <= (os.cpu_count() or 1):
+        inicio = time.perf_counter()
+        assert cantidad_alcanzables_en_paralelo(foto, origenes, procesos) == esperado
+        segundos = time.perf_counter() - inicio
+        print(f'{procesos:3} procesos: {segundos:6.2f} s  x{secuencial / segundos:.1f}')
+        procesos *= 2
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+import csv
+import io
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from grafo_adyacencia import GrafoAdyacencia
+from grafo_simple import Grafo
+from matriz_adyacencia import MatrizAdyacencia
+
+
+def csv_de_aristas(nodos: int, aristas: int) -> str:
+    # Aristas distintas en ambos sentidos, para que grafo_simple.Grafo las acepte todas
+    random.seed(0)
+    vistas: set[tuple[int, int]] = set()
+    filas = io.StringIO()
+    escritor = csv.writer(filas)
+    while len(vistas) < aristas:
+        origen, destino = random.randrange(nodos), random.randrange(nodos)
+        if (origen, destino) in vistas or (destino, origen) in vistas:
+            continue
+        vistas.add((origen, destino))
+        escritor.writerow((origen, destino))
+    return filas.getvalue()
+
+
+def leer(texto: str):
+    # Generador sobre el CSV, como al leer un archivo de millones de filas
+    return ((int(origen), int(destino)) for origen, destino in csv.reader(io.StringIO(texto)))
+
+
+def una_por_una(grafo, nodos: int, texto: str) -> float:
+    inicio = time.perf_counter()
+    for nodo in range(nodos):
+        grafo.agregar_nodo(nodo)
+    for origen, destino in leer(texto):
+        grafo.agregar_arista(origen, destino)
+    return time.perf_counter() - inicio
+
+
+def en_lote(grafo, nodos: int, texto: str) -> float:
+    inicio = time.perf_counter()
+    for nodo in range(nodos):
+        grafo.agregar_nodo(nodo)
+    grafo.agregar_aristas(leer(texto))
+    return time.perf_counter() - inicio
+
+
+def solo_lectura(texto: str) -> float:
+    inicio = time.perf_counter()
+    for _ in leer(texto):
+        pass
+    return time.perf_counter() - inicio
+
+
+def main():
+    casos = [
+        ('GrafoAdyacencia', GrafoAdyacencia, 200_000, 1_000_000),
+        ('grafo_simple.Grafo', Grafo, 200_000, 1_000_000),
+        ('MatrizAdyacencia', MatrizAdyacencia, 20_000, 200_000),
+    ]
+    for nombre, clase, nodos, aristas in casos:
+        texto = csv_de_aristas(nodos, aristas)
+        lectura = solo_lectura(texto)
+        lento = una_por_una(clase(), nodos, texto)
+        rapido = en_lote(clase(), nodos, texto)
+        print(f'{nombre} ({nodos} nodos, {aristas} aristas, lectura del CSV {lectura:.2f} s)')
+        print(f'  agregar_arista en bucle: {lento:6.2f} s  {aristas / lento:12.0f} aristas/s')
+        print(f'  agregar_aristas:         {rapido:6.2f} s  {aristas / rapido:12.0f} aristas/s')
+        print(f'  sin contar la lectura:   x{(lento - lectura) / (rapido - lectura):.1f}')
+
+
+if __name__ == '__main__':
+    main()
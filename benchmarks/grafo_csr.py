@@ -0,0 +1,66 @@
+import os
+import pickle
+import random
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from algoritmos_grafo import bfs
+from grafo_adyacencia import GrafoAdyacencia
+from grafo_csr import GrafoCSR
+
+NODOS = 100_000
+ARISTAS = 500_000
+
+
+def grafo_aleatorio() -> GrafoAdyacencia[int]:
+    random.seed(0)
+    grafo: GrafoAdyacencia[int] = GrafoAdyacencia()
+    for nodo in range(NODOS):
+        grafo.agregar_nodo(nodo)
+    for _ in range(ARISTAS):
+        origen, destino = random.randrange(NODOS), random.randrange(NODOS)
+        if not grafo.es_vecino_de(origen, destino):
+            grafo.agregar_arista(origen, destino)
+    return grafo
+
+
+def medir(nombre: str, funcion, repeticiones: int = 3) -> float:
+    segundos = min(timeit.repeat(funcion, number=1, repeat=repeticiones))
+    print(f'{nombre:32} {segundos * 1e3:9.1f} ms')
+    return segundos
+
+
+def main():
+    grafo = grafo_aleatorio()
+    csr = grafo.freeze()
+    print(f'{NODOS} nodos, {csr.cantidad_aristas()} aristas dirigidas en CSR')
+    medir('freeze()', grafo.freeze)
+    # Mismo trabajo sobre el grafo mutable y sobre la foto CSR
+    medir('bfs GrafoAdyacencia', lambda: sum(1 for _ in bfs(grafo, 0)))
+    medir('bfs GrafoCSR', lambda: len(csr.bfs_id(0)))
+    medir('vecinos GrafoAdyacencia', lambda: sum(1 for n in grafo.nodos for _ in grafo.vecinos_de(n)))
+    medir('vecinos GrafoCSR', lambda: sum(1 for i in range(NODOS) for _ in csr.vecinos_id(i)))
+    medir('grados GrafoAdyacencia', lambda: {n: len(v) for n, v in grafo.lista_adyacencia.items()})
+    medir('grados GrafoCSR', csr.grados)
+
+    for nombre, objeto in (('GrafoAdyacencia', grafo), ('GrafoCSR', csr)):
+        datos = pickle.dumps(objeto, protocol=pickle.HIGHEST_PROTOCOL)
+        print(f'pickle {nombre}: {len(datos) / 1e6:.1f} MB')
+        medir(f'pickle.dumps {nombre}', lambda: pickle.dumps(objeto, protocol=pickle.HIGHEST_PROTOCOL))
+        medir(f'pickle.loads {nombre}', lambda: pickle.loads(datos))
+
+    # Archivo mapeado: la carga no lee los arreglos, solo la cabecera
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, 'grafo.csr')
+        medir('guardar', lambda: csr.guardar(ruta))
+        print(f'archivo: {os.path.getsize(ruta) / 1e6:.1f} MB')
+        medir('cargar (mmap)', lambda: GrafoCSR.cargar(ruta))
+        medir('cargar + bfs por id', lambda: len(GrafoCSR.cargar(ruta).bfs_id(0)))
+        medir('cargar + vecinos_de', lambda: GrafoCSR.cargar(ruta).vecinos_de(0))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+import os
+import random
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from arbol_avl import ArbolAVL
+from arbol_binario_ordenado import ArbolBinarioOrdenado
+
+N = 100_000
+
+
+def bytes_por_nodo(construir) -> float:
+    # Los valores se crean antes de medir: solo se cuenta la estructura del árbol
+    valores = list(range(N))
+    random.seed(0)
+    random.shuffle(valores)
+    tracemalloc.start()
+    arbol = construir(valores)
+    memoria, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(arbol) == N
+    return memoria / N
+
+
+def insertar_uno_a_uno(clase):
+    def construir(valores):
+        arbol = clase()
+        for valor in valores:
+            arbol.insertar(valor)
+        return arbol
+    return construir
+
+
+def recorrer(arbol) -> int:
+    # Recorrido con la API pública (si()/sd()/dato()), como lo haría quien usa la biblioteca
+    visitados = 0
+    pila = [arbol]
+    while pila:
+        subarbol = pila.pop()
+        if not subarbol.es_vacio():
+            subarbol.dato()
+            visitados += 1
+            pila.append(subarbol.sd())
+            pila.append(subarbol.si())
+    return visitados
+
+
+def bytes_recorrido_tras_foto() -> int:
+    # Después de snapshot() los nodos quedan compartidos con la foto: leerlos no debe copiarlos
+    arbol = ArbolAVL.desde_iterable(range(N))
+    foto = arbol.snapshot()
+    tracemalloc.start()
+    visitados = recorrer(arbol) + recorrer(foto)
+    memoria, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert visitados == 2 * N
+    assert memoria < 64 * 1024, 'el recorrido copió nodos'
+    return memoria
+
+
+def main():
+    print(f'Bytes por nodo ({N} nodos)')
+    print(f'ArbolBinarioOrdenado.insertar:        {bytes_por_nodo(insertar_uno_a_uno(ArbolBinarioOrdenado)):8.1f}')
+    print(f'ArbolAVL.insertar:                    {bytes_por_nodo(insertar_uno_a_uno(ArbolAVL)):8.1f}')
+    print(f'ArbolBinarioOrdenado.desde_iterable:  {bytes_por_nodo(ArbolBinarioOrdenado.desde_iterable):8.1f}')
+    print(f'Bytes al recorrer árbol y foto con si()/sd(): {bytes_recorrido_tras_foto()}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+import os
+import pickle
+import random
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from arbol_binario import ArbolBinario
+from arbol_binario_ordenado import ArbolBinarioOrdenado
+
+NODOS = 200_000
+
+
+def medir(nombre: str, funcion, repeticiones: int = 3) -> float:
+    segundos = min(timeit.repeat(funcion, number=1, repeat=repeticiones))
+    print(f'{nombre:32} {segundos * 1e3:9.1f} ms')
+    return segundos
+
+
+def guardar(arbol, ruta: str):
+    with open(ruta, 'wb') as archivo:
+        arbol.guardar(archivo)
+
+
+def cargar(cls, ruta: str):
+    with open(ruta, 'rb') as archivo:
+        return cls.cargar(archivo)
+
+
+def comparar(nombre: str, arbol, cls, directorio: str):
+    print(nombre)
+    # pickle recorre el árbol recursivamente: con árboles balanceados no llega al límite de recursión
+    datos = pickle.dumps(arbol, protocol=pickle.HIGHEST_PROTOCOL)
+    print(f'  pickle: {len(datos) / 1e6:.1f} MB')
+    medir('  pickle.dumps', lambda: pickle.dumps(arbol, protocol=pickle.HIGHEST_PROTOCOL))
+    medir('  pickle.loads', lambda: pickle.loads(datos))
+    ruta = os.path.join(directorio, 'arbol.bin')
+    medir('  guardar', lambda: guardar(arbol, ruta))
+    print(f'  archivo: {os.path.getsize(ruta) / 1e6:.1f} MB')
+    medir('  cargar', lambda: cargar(cls, ruta))
+
+
+def main():
+    random.seed(0)
+    enteros = random.sample(range(10 * NODOS), NODOS)
+    ordenado = ArbolBinarioOrdenado.desde_iterable(enteros)
+    # Mismos nodos como ArbolBinario: se guarda la forma (bits de hijos) además de los datos
+    con_forma = ArbolBinario._desde_preorden(
+        (nodo.dato, (nodo._si.raiz is not None) | (nodo._sd.raiz is not None) << 1)
+        for nodo in ordenado._nodos_preorder()
+    )
+    textos = ArbolBinarioOrdenado.desde_iterable(f'clave-{n}' for n in enteros)
+    with tempfile.TemporaryDirectory() as directorio:
+        comparar(f'ArbolBinarioOrdenado, {NODOS} enteros (claves)', ordenado, ArbolBinarioOrdenado, directorio)
+        comparar(f'ArbolBinario, {NODOS} enteros (forma)', con_forma, ArbolBinario, directorio)
+        comparar(f'ArbolBinarioOrdenado, {NODOS} textos (claves)', textos, ArbolBinarioOrdenado, directorio)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+from collections.abc import Collection, Iterable, Iterator
+from itertools import chain, islice
+from typing import Any, Optional
+
+# Aristas que se validan y cargan juntas: acota la memoria al leer de un iterable sin fin conocido
+TAMANO_LOTE = 65_536
+
+
+class ResumenCarga:
+  """Resultado de una carga masiva de aristas (agregar_aristas)."""
+  def __init__(self, aristas: int, nodos_creados: int, segundos: float) -> None:
+    self.aristas = aristas
+    self.nodos_creados = nodos_creados
+    self.segundos = segundos
+
+  @property
+  def aristas_por_segundo(self) -> float:
+    return self.aristas / self.segundos if self.segundos > 0 else float('inf')
+
+  def __repr__(self) -> str:
+    return (
+      f"ResumenCarga(aristas={self.aristas}, nodos_creados={self.nodos_creados}, "
+      f"segundos={self.segundos:.3f}, aristas_por_segundo={self.aristas_por_segundo:.0f})"
+    )
+
+
+def lotes_de_aristas(
+  aristas: Iterable[tuple[Any, ...]], tamano: int = TAMANO_LOTE
+) -> Iterator[tuple[list[Any], list[Any], Optional[list[float]]]]:
+  """Consume aristas (origen, destino) u (origen, destino, peso) de a lotes, separadas en columnas.
+
+  Cada lote es (origenes, destinos, pesos); pesos es None si ninguna arista del lote trae peso.
+  """
+  iterador = iter(aristas)
+  while lote := list(islice(iterador, tamano)):
+    largos = set(map(len, lote))
+    if not largos <= {2, 3}:
+      raise ValueError("Cada arista debe ser (origen, destino) u (origen, destino, peso)")
+    origenes = [arista[0] for arista in lote]
+    destinos = [arista[1] for arista in lote]
+    pesos = [arista[2] if len(arista) == 3 else 1 for arista in lote] if 3 in largos else None
+    yield origenes, destinos, pesos
+
+
+def nodos_faltantes(existentes: Collection[Any], origenes: list[Any], destinos: list[Any]) -> list[Any]:
+  # Extremos del lote que no están en el grafo, sin repetir y en orden de aparición.
+  # La diferencia de conjuntos resuelve el caso común (no falta ninguno) sin bucle en Python
+  extremos = set(origenes)
+  extremos.update(destinos)
+  faltantes = extremos.difference(existentes)
+  if not faltantes:
+    return []
+  return [nodo for nodo in dict.fromkeys(chain(origenes, destinos)) if nodo in faltantes]
@@ -0,0 +1,54 @@
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from typing import Any, TextIO
+
+# Líneas que se juntan en cada write: pocas llamadas al archivo sin armar el texto entero en memoria
+LINEAS_POR_BLOQUE = 4096
+
+
+def escribir_lineas(archivo: TextIO, lineas: Iterable[str], tamano: int = LINEAS_POR_BLOQUE) -> None:
+  """Escribe las líneas (con su salto de línea) en archivo, de a bloques."""
+  iterador = iter(lineas)
+  while bloque := ''.join(islice(iterador, tamano)):
+    archivo.write(bloque)
+
+
+def id_dot(valor: Any) -> str:
+  # Identificador de Graphviz entre comillas: cualquier nodo sirve, aunque su str tenga espacios o comillas
+  return '"' + str(valor).replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def escribir_lista_aristas(archivo: TextIO, aristas: Iterable[tuple[Any, Any, float]]) -> None:
+  """Una arista por línea: 'origen destino', o 'origen destino peso' si no pesa 1."""
+  escribir_lineas(archivo, (
+    f'{origen} {destino}\n' if peso == 1 else f'{origen} {destino} {peso}\n'
+    for origen, destino, peso in aristas
+  ))
+
+
+def escribir_lista_adyacencia(archivo: TextIO, filas: Iterable[tuple[Any, Iterable[Any]]]) -> None:
+  """Un nodo por línea seguido de sus vecinos: 'nodo vecino vecino ...'."""
+  escribir_lineas(archivo, (
+    ' '.join(map(str, (nodo, *vecinos))) + '\n' for nodo, vecinos in filas
+  ))
+
+
+def _lineas_dot(
+  nodos: Iterable[Any], aristas: Iterable[tuple[Any, Any, float]], dirigido: bool
+) -> Iterator[str]:
+  yield 'digraph G {\n' if dirigido else 'graph G {\n'
+  # Los nodos se declaran aparte para que también aparezcan los que no tienen aristas
+  for nodo in nodos:
+    yield f'  {id_dot(nodo)};\n'
+  conector = '->' if dirigido else '--'
+  for origen, destino, peso in aristas:
+    atributos = '' if peso == 1 else f' [weight={peso}, label="{peso}"]'
+    yield f'  {id_dot(origen)} {conector} {id_dot(destino)}{atributos};\n'
+  yield '}\n'
+
+
+def escribir_dot(
+  archivo: TextIO, nodos: Iterable[Any], aristas: Iterable[tuple[Any, Any, float]], dirigido: bool = False
+) -> None:
+  """Grafo en formato DOT de Graphviz (dot -Tsvg archivo.dot > archivo.svg)."""
+  escribir_lineas(archivo, _lineas_dot(nodos, aristas, dirigido))
@@ -1,35 +1,144 @@
-import matplotlib.pyplot as plt
-import networkx as nx
+from collections.abc import Callable
+from typing import Optional, TypeVar
 
-# Función para agregar nodos al gráfico de un árbol
-def add_edges(tree, graph, pos=None, x=0, y=0, layer=1, spread=1):
-    if tree is None:
-        return
+# matplotlib y networkx se importan recién al dibujar: importar los TADs no los carga
 
-    graph.add_node(tree['value'], pos=(x, y))
+N = TypeVar('N')
 
-    if pos is None:
-        pos = {}
-    pos[tree['value']] = (x, y)
+def _dibujar(G, pos, archivo: Optional[str], etiquetas: Optional[dict] = None) -> None:
+    # Sin archivo se muestra en pantalla; con archivo (.png, .svg, ...) se guarda sin interfaz gráfica
+    import networkx as nx
+    opciones = dict(with_labels=True, node_size=2000, node_color="lightblue", font_size=10, font_weight="bold")
+    if etiquetas is not None:
+        opciones['labels'] = etiquetas
+    if archivo is None:
+        import matplotlib.pyplot as plt
+        nx.draw(G, pos, **opciones)
+        plt.show()
+        return
+    # Figura suelta, fuera del estado de pyplot: no necesita backend interactivo ni queda abierta
+    from matplotlib.figure import Figure
+    figura = Figure()
+    nx.draw(G, pos, ax=figura.subplots(), **opciones)
+    figura.savefig(archivo)
 
-    if 'left' in tree and tree['left']:
-        graph.add_edge(tree['value'], tree['left']['value'])
-        add_edges(tree['left'], graph, pos, x - spread / layer, y - 1, layer + 1, spread)
+# Disposición ordenada (Reingold–Tilford) de un árbol binario, iterativa y en O(n).
+# Trabaja directamente sobre los nodos: hijos(nodo) devuelve (izquierdo, derecho), con None si falta.
+# Cada nodo se identifica por su posición en el recorrido, no por su dato, así que los datos repetidos
+# no se mezclan. Devuelve, por posición: el nodo, la posición de su padre (None para la raíz), su x y su nivel.
+def disposicion_arbol(raiz: Optional[N], hijos: Callable[[N], tuple[Optional[N], Optional[N]]],
+                      separacion: int = 2) -> tuple[list[N], list[Optional[int]], list[float], list[int]]:
+    nodos: list[N] = []
+    padres: list[Optional[int]] = []
+    niveles: list[int] = []
+    izquierdos: list[Optional[int]] = []
+    derechos: list[Optional[int]] = []
+    # Preorden que numera los nodos; recorrido al revés es un posorden (hijos antes que el padre)
+    pila: list[tuple[N, Optional[int], int, bool]] = [] if raiz is None else [(raiz, None, 0, False)]
+    while pila:
+        nodo, padre, nivel, es_derecho = pila.pop()
+        i = len(nodos)
+        nodos.append(nodo)
+        padres.append(padre)
+        niveles.append(nivel)
+        izquierdos.append(None)
+        derechos.append(None)
+        if padre is not None:
+            if es_derecho:
+                derechos[padre] = i
+            else:
+                izquierdos[padre] = i
+        izquierdo, derecho = hijos(nodo)
+        if derecho is not None:
+            pila.append((derecho, i, nivel + 1, True))
+        if izquierdo is not None:
+            pila.append((izquierdo, i, nivel + 1, False))
 
-    if 'right' in tree and tree['right']:
-        graph.add_edge(tree['value'], tree['right']['value'])
-        add_edges(tree['right'], graph, pos, x + spread / layer, y - 1, layer + 1, spread)
+    n = len(nodos)
+    # Distancia horizontal de cada nodo a sus hijos (quedan en -desplazamiento y +desplazamiento)
+    desplazamiento = [0] * n
+    # Siguiente nodo del contorno izquierdo/derecho un nivel más abajo (un hijo o un hilo) y su x relativa
+    sig_izq: list[Optional[int]] = [None] * n
+    sig_der: list[Optional[int]] = [None] * n
+    dx_izq = [0] * n
+    dx_der = [0] * n
+    # Nodo más bajo de cada contorno, con su x relativa a la raíz del subárbol, y la altura del subárbol
+    bajo_izq = list(range(n))
+    bajo_der = list(range(n))
+    x_bajo_izq = [0] * n
+    x_bajo_der = [0] * n
+    altura = [1] * n
+    for v in reversed(range(n)):
+        izq, der = izquierdos[v], derechos[v]
+        if izq is None and der is None:
+            continue
+        if izq is None or der is None:
+            # Un solo hijo: va corrido media separación hacia su lado
+            hijo = izq if der is None else der
+            d = -(separacion // 2) if der is None else separacion // 2
+            desplazamiento[v] = separacion // 2
+            sig_izq[v] = sig_der[v] = hijo
+            dx_izq[v] = dx_der[v] = d
+            bajo_izq[v], x_bajo_izq[v] = bajo_izq[hijo], x_bajo_izq[hijo] + d
+            bajo_der[v], x_bajo_der[v] = bajo_der[hijo], x_bajo_der[hijo] + d
+            altura[v] = altura[hijo] + 1
+            continue
+        # Se bajan a la par el contorno derecho del subárbol izquierdo y el izquierdo del derecho,
+        # buscando la distancia mínima entre las raíces; solo se recorre la altura del más bajo
+        a, b = izq, der
+        xa = xb = 0
+        necesaria = separacion
+        while True:
+            necesaria = max(necesaria, xa - xb + separacion)
+            if sig_der[a] is None or sig_izq[b] is None:
+                break
+            xa += dx_der[a]
+            xb += dx_izq[b]
+            a, b = sig_der[a], sig_izq[b]
+        d = (necesaria + 1) // 2
+        desplazamiento[v] = d
+        sig_izq[v], dx_izq[v] = izq, -d
+        sig_der[v], dx_der[v] = der, d
+        # Hilos: donde termina el contorno del subárbol más bajo, sigue el del más alto
+        if sig_der[a] is None and sig_izq[b] is not None:
+            hoja = bajo_izq[izq]
+            sig_izq[hoja] = sig_izq[b]
+            dx_izq[hoja] = (d + xb + dx_izq[b]) - (-d + x_bajo_izq[izq])
+        elif sig_izq[b] is None and sig_der[a] is not None:
+            hoja = bajo_der[der]
+            sig_der[hoja] = sig_der[a]
+            dx_der[hoja] = (-d + xa + dx_der[a]) - (d + x_bajo_der[der])
+        if altura[izq] >= altura[der]:
+            bajo_izq[v], x_bajo_izq[v] = bajo_izq[izq], x_bajo_izq[izq] - d
+        else:
+            bajo_izq[v], x_bajo_izq[v] = bajo_izq[der], x_bajo_izq[der] + d
+        if altura[der] >= altura[izq]:
+            bajo_der[v], x_bajo_der[v] = bajo_der[der], x_bajo_der[der] + d
+        else:
+            bajo_der[v], x_bajo_der[v] = bajo_der[izq], x_bajo_der[izq] - d
+        altura[v] = max(altura[izq], altura[der]) + 1
 
-    return pos
+    # x absolutas: en preorden los padres se ubican antes que sus hijos
+    xs = [0.0] * n
+    for i in range(1, n):
+        padre = padres[i]
+        xs[i] = xs[padre] + (desplazamiento[padre] if derechos[padre] == i else -desplazamiento[padre])
+    return nodos, padres, xs, niveles
 
-def grafico_arbol_binario(dict_binary_tree):
+def grafico_arbol_binario(raiz, hijos, dato, archivo: Optional[str] = None):
+    import networkx as nx
     G = nx.Graph() # Crear un grafo
-    pos = add_edges(dict_binary_tree, G) # Añadir los nodos y las conexiones
+    nodos, padres, xs, niveles = disposicion_arbol(raiz, hijos)
+    # Añadir los nodos y las conexiones, identificados por posición y rotulados con su dato
+    G.add_nodes_from(range(len(nodos)))
+    G.add_edges_from((padre, i) for i, padre in enumerate(padres) if padre is not None)
+    pos = {i: (x, -nivel) for i, (x, nivel) in enumerate(zip(xs, niveles))}
+    etiquetas = {i: dato(nodo) for i, nodo in enumerate(nodos)}
     # Dibujar el árbol
-    nx.draw(G, pos, with_labels=True, node_size=2000, node_color="lightblue", font_size=10, font_weight="bold")
-    plt.show()
+    _dibujar(G, pos, archivo, etiquetas)
     
-def grafico_grafo(matriz_adyacencia: list[list[int]], nodos: list) -> None:
+def grafico_grafo(matriz_adyacencia: list[list[int]], nodos: list, archivo: Optional[str] = None) -> None:
+    import networkx as nx
     G = nx.Graph()  # Crear un grafo
 
     # Agregar nodos
@@ -44,10 +153,10 @@ def grafico_grafo(matriz_adyacencia: list[list[int]], nodos: list) -> None:
 
     # Dibujar el grafo
     pos = nx.spring_layout(G)  # Posicionar nodos de manera atractiva
-    nx.draw(G, pos, with_labels=True, node_size=2000, node_color="lightblue", font_size=10, font_weight="bold")
-    plt.show()
+    _dibujar(G, pos, archivo)
     
-def grafico_grafo_simple(nodos, aristas) -> None:
+def grafico_grafo_simple(nodos, aristas, archivo: Optional[str] = None) -> None:
+    import networkx as nx
     G = nx.Graph()  # Crear un grafo
 
     # Agregar nodos
@@ -60,5 +169,4 @@ def grafico_grafo_simple(nodos, aristas) -> None:
 
     # Dibujar el grafo
     pos = nx.spring_layout(G)  # Posicionar nodos de manera atractiva
-    nx.draw(G, pos, with_labels=True, node_size=2000, node_color="lightblue", font_size=10, font_weight="bold")
-    plt.show()
\ No newline at end of file
+    _dibujar(G, pos, archivo)
\ No newline at end of file
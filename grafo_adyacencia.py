@@ -1,23 +1,96 @@
-from typing import Generic, TypeVar
+import time
+from collections.abc import Iterable, Iterator
+from itertools import repeat
+from typing import Any, Generic, Optional, TextIO, TypeVar
+import exportar
+from carga_aristas import ResumenCarga, lotes_de_aristas, nodos_faltantes
+from grafo_csr import GrafoCSR
 
 T = TypeVar('T')
 
 class GrafoAdyacencia(Generic[T]):
-  def __init__(self) -> None:
+  def __init__(self, dirigido: bool = False) -> None:
+    self.dirigido = dirigido
+    # Vecinos salientes de cada nodo
     self.lista_adyacencia: dict[T, set[T]] = {}
+    # Vecinos entrantes: en un grafo no dirigido coinciden con los salientes y es el mismo diccionario
+    self.lista_entrantes: dict[T, set[T]] = {} if dirigido else self.lista_adyacencia
+    # Pesos de las aristas que no pesan 1 (en ambos sentidos si el grafo no es dirigido)
+    self.pesos: dict[tuple[T, T], float] = {}
+
+  @property
+  def nodos(self):
+    # Vista de solo lectura de los nodos (ver algoritmos_grafo.Adyacencia)
+    return self.lista_adyacencia.keys()
 
   def agregar_nodo(self, nodo: T) -> None:
     if nodo in self.lista_adyacencia:
       raise ValueError("Ya existe el nodo en el grafo")
     self.lista_adyacencia[nodo] = set()
+    if self.dirigido:
+      self.lista_entrantes[nodo] = set()
     
-  def agregar_arista(self, origen: T, destino: T) -> None:
+  def agregar_arista(self, origen: T, destino: T, peso: float = 1) -> None:
     if not origen in self.lista_adyacencia:
       raise ValueError("No existe el nodo origen en el grafo")
     if not destino in self.lista_adyacencia:
       raise ValueError("No existe el nodo destino en el grafo")
     self.lista_adyacencia[origen].add(destino)
-    self.lista_adyacencia[destino].add(origen)
+    self.lista_entrantes[destino].add(origen)
+    self.pesos.pop((origen, destino), None)
+    if not self.dirigido:
+      self.pesos.pop((destino, origen), None)
+    if peso != 1:
+      self.pesos[(origen, destino)] = peso
+      if not self.dirigido:
+        self.pesos[(destino, origen)] = peso
+
+  def agregar_aristas(self, aristas: Iterable[tuple[Any, ...]], crear_nodos: bool = False) -> ResumenCarga:
+    """Carga masiva de aristas (origen, destino) u (origen, destino, peso) desde cualquier iterable.
+
+    Se consume de a lotes (ver carga_aristas): los extremos de cada lote se validan
+    juntos antes de tocar el grafo. Si falta alguno y crear_nodos es False se lanza
+    ValueError y el lote no se carga (los anteriores quedan cargados).
+    """
+    inicio = time.perf_counter()
+    total = creados = 0
+    salientes = self.lista_adyacencia
+    entrantes = self.lista_entrantes
+    for origenes, destinos, pesos in lotes_de_aristas(aristas):
+      faltantes = nodos_faltantes(salientes, origenes, destinos)
+      if faltantes:
+        if not crear_nodos:
+          raise ValueError("No existe en el grafo el nodo origen o destino de una arista")
+        for nodo in faltantes:
+          self.agregar_nodo(nodo)
+        creados += len(faltantes)
+      # En un grafo no dirigido entrantes es salientes: se agregan ambos sentidos
+      for origen, destino in zip(origenes, destinos):
+        salientes[origen].add(destino)
+        entrantes[destino].add(origen)
+      # Los pesos solo se tocan si hay alguno guardado o el lote trae pesos; en orden, como agregar_arista
+      if self.pesos or pesos is not None:
+        for origen, destino, peso in zip(origenes, destinos, repeat(1) if pesos is None else pesos):
+          self.pesos.pop((origen, destino), None)
+          if not self.dirigido:
+            self.pesos.pop((destino, origen), None)
+          if peso != 1:
+            self.pesos[(origen, destino)] = peso
+            if not self.dirigido:
+              self.pesos[(destino, origen)] = peso
+      total += len(origenes)
+    return ResumenCarga(total, creados, time.perf_counter() - inicio)
+
+  @classmethod
+  def desde_lista_aristas(
+    cls, aristas: Iterable[tuple[Any, ...]], nodos: Optional[Iterable[T]] = None, dirigido: bool = False
+  ) -> "GrafoAdyacencia[T]":
+    # Los nodos sueltos van en nodos; los extremos de las aristas se crean solos
+    grafo: GrafoAdyacencia[T] = cls(dirigido)
+    for nodo in nodos or ():
+      grafo.agregar_nodo(nodo)
+    grafo.agregar_aristas(aristas, crear_nodos=True)
+    return grafo
   
   def eliminar_arista(self, origen: T, destino: T) -> None:
     if not origen in self.lista_adyacencia:
@@ -28,35 +101,90 @@ class GrafoAdyacencia(Generic[T]):
       raise ValueError("No existe una arista entre los nodos")
         
     self.lista_adyacencia[origen].remove(destino)
-    self.lista_adyacencia[destino].remove(origen)
+    self.lista_entrantes[destino].discard(origen)
+    self.pesos.pop((origen, destino), None)
+    if not self.dirigido:
+      self.pesos.pop((destino, origen), None)
   
   def eliminar_nodo(self, nodo: T) -> None:
     if not nodo in self.lista_adyacencia:
       raise ValueError("No existe el nodo a eliminar")
-    adyacentes = list(self.lista_adyacencia[nodo])
-    for adyacente in adyacentes:
-      self.eliminar_arista(nodo, adyacente)
-    del self.lista_adyacencia[nodo]
+    # Solo se tocan las aristas del nodo: O(grado entrante + grado saliente)
+    for sucesor in self.lista_adyacencia.pop(nodo):
+      if sucesor != nodo:
+        self.lista_entrantes[sucesor].discard(nodo)
+      self.pesos.pop((nodo, sucesor), None)
+      self.pesos.pop((sucesor, nodo), None)
+    if self.dirigido:
+      for predecesor in self.lista_entrantes.pop(nodo):
+        if predecesor != nodo:
+          self.lista_adyacencia[predecesor].discard(nodo)
+        self.pesos.pop((predecesor, nodo), None)
     
   def es_vecino_de(self, nodo: T, otro_nodo: T) -> bool:
     if not nodo in self.lista_adyacencia:
       raise ValueError("No existe el nodo en el grafo")
     if not otro_nodo in self.lista_adyacencia:
       raise ValueError("No existe el otro_nodo en el grafo")
-    return otro_nodo in self.lista_adyacencia(nodo)
+    return otro_nodo in self.lista_adyacencia[nodo]
   def vecinos_de(self, nodo: T) -> set[T]:
     if not nodo in self.lista_adyacencia:
       raise ValueError("No existe el nodo en el grafo")
     return self.lista_adyacencia[nodo]
+
+  def entrantes_de(self, nodo: T) -> set[T]:
+    # Nodos con una arista hacia nodo (en un grafo no dirigido, sus vecinos)
+    if not nodo in self.lista_entrantes:
+      raise ValueError("No existe el nodo en el grafo")
+    return self.lista_entrantes[nodo]
+
+  def peso(self, origen: T, destino: T) -> float:
+    if not destino in self.vecinos_de(origen):
+      raise ValueError("No existe una arista entre los nodos")
+    return self.pesos.get((origen, destino), 1)
+
+  def vecinos_con_peso(self, nodo: T) -> Iterator[tuple[T, float]]:
+    pesos = self.pesos
+    return ((vecino, pesos.get((nodo, vecino), 1)) for vecino in self.vecinos_de(nodo))
+
+  def freeze(self) -> GrafoCSR[T]:
+    # Foto inmutable en formato CSR para consultas intensivas; no refleja cambios posteriores
+    return GrafoCSR.desde_grafo(self, self.dirigido)
+
+  def iter_aristas(self) -> Iterator[tuple[T, T, float]]:
+    # (origen, destino, peso) de cada arista; en un grafo no dirigido, una sola vez por arista
+    pesos = self.pesos
+    if self.dirigido:
+      for origen, destinos in self.lista_adyacencia.items():
+        for destino in destinos:
+          yield origen, destino, pesos.get((origen, destino), 1)
+      return
+    # Se sale de un extremo solo hacia los nodos que no lo precedían (memoria extra O(V))
+    posiciones = {nodo: i for i, nodo in enumerate(self.lista_adyacencia)}
+    for origen, destinos in self.lista_adyacencia.items():
+      posicion = posiciones[origen]
+      for destino in destinos:
+        if posiciones[destino] >= posicion:
+          yield origen, destino, pesos.get((origen, destino), 1)
+
+  # Exportación a un archivo de texto abierto (ver exportar): se escribe de a bloques, en O(V + E)
+  def escribir_dot(self, archivo: TextIO) -> None:
+    exportar.escribir_dot(archivo, self.lista_adyacencia, self.iter_aristas(), self.dirigido)
+
+  def escribir_lista_aristas(self, archivo: TextIO) -> None:
+    exportar.escribir_lista_aristas(archivo, self.iter_aristas())
+
+  def escribir_lista_adyacencia(self, archivo: TextIO) -> None:
+    exportar.escribir_lista_adyacencia(archivo, self.lista_adyacencia.items())
+
   def __str__(self):
     # Verificamos que el diccionario no esté vacío
     if not self.lista_adyacencia:
         return "El diccionario está vacío.\n"
-    
-    resultado = "GrafoAdyacencia\n"
-    for clave, valor in self.lista_adyacencia.items():
-        resultado += "\t" + str(clave) + ": " + str([dato for dato in valor]) + "\n"
-    return resultado
+    # Una línea por nodo, unidas al final (concatenar con += en el bucle es cuadrático)
+    return "GrafoAdyacencia\n" + "".join(
+      "\t" + str(clave) + ": " + str(list(valor)) + "\n" for clave, valor in self.lista_adyacencia.items()
+    )
   def ver_grafo(self):
     for key, values in self.lista_adyacencia.items():
       print(key,":", values)
@@ -80,4 +208,13 @@ if __name__ == '__main__':
   grafo.eliminar_nodo(1)
   print("Eliminamos el nodo 1")
   grafo.ver_grafo()
-  print("vecinos de 4:", grafo.vecinos_de(4))
\ No newline at end of file
+  print("vecinos de 4:", grafo.vecinos_de(4))
+
+  dependencias = GrafoAdyacencia(dirigido=True)
+  for tarea in ["compilar", "testear", "empaquetar", "publicar"]:
+    dependencias.agregar_nodo(tarea)
+  dependencias.agregar_arista("compilar", "testear")
+  dependencias.agregar_arista("compilar", "empaquetar")
+  dependencias.agregar_arista("testear", "publicar")
+  dependencias.agregar_arista("empaquetar", "publicar")
+  print("apuntan a publicar:", dependencias.entrantes_de("publicar"))
\ No newline at end of file
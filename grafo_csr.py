@@ -0,0 +1,256 @@
+import mmap
+import pickle
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from operator import sub
+from collections.abc import Iterable, Iterator
+from typing import Generic, Optional, Protocol, TypeVar, Union
+
+T = TypeVar('T')
+
+# Arreglo de enteros o de pesos: array en memoria, o memoryview sobre un archivo mapeado
+Arreglo = Union[array, memoryview]
+
+# Formato en disco (ver GrafoCSR.guardar): cabecera, desplazamientos, vecinos, pesos (opcional) y
+# la tabla de nodos serializada con pickle. Los arreglos se escriben en el formato nativo de
+# array('l')/array('d'), así que se pueden mapear y leer sin convertirlos.
+_MAGICO = b'GRAFOCSR'
+_VERSION = 1
+# mágico, versión, bytes por entero, banderas, cantidad de nodos, de aristas y bytes de la tabla de nodos
+_CABECERA = struct.Struct('<8sHBB4xqqq')
+_DIRIGIDO = 1
+_CON_PESOS = 2
+_BIG_ENDIAN = 4
+
+
+class _GrafoPonderado(Protocol[T]):
+  @property
+  def nodos(self) -> Iterable[T]: ...
+  def vecinos_con_peso(self, nodo: T) -> Iterable[tuple[T, float]]: ...
+
+
+class GrafoCSR(Generic[T]):
+  """Foto inmutable de un grafo en formato CSR (compressed sparse row).
+
+  Cada nodo tiene un id entre 0 y V-1. Los vecinos (salientes) del nodo i son
+  vecinos[desplazamientos[i]:desplazamientos[i + 1]], ordenados por id. Todo
+  vive en arreglos contiguos de enteros: recorrer el grafo no crea objetos por
+  arista y la foto se serializa como unos pocos bloques de bytes.
+  Se obtiene con freeze() de GrafoAdyacencia, MatrizAdyacencia o grafo_simple.Grafo,
+  o con GrafoCSR.cargar() de un archivo escrito por guardar().
+  """
+  def __init__(
+    self,
+    lista_nodos: Optional[list[T]],
+    desplazamientos: Arreglo,
+    vecinos: Arreglo,
+    pesos: Optional[Arreglo] = None,
+    dirigido: bool = False
+  ) -> None:
+    # Tabla id -> nodo y su inversa nodo -> id; en un grafo cargado de disco se arman recién al usarlas
+    self._lista_nodos = lista_nodos
+    self._indices: Optional[dict[T, int]] = None
+    self._etiquetas: Optional[memoryview] = None
+    self._mapa: Optional[mmap.mmap] = None
+    # Archivo del que se cargó el grafo (los procesos de algoritmos_paralelos lo vuelven a mapear)
+    self._ruta: Optional[str] = None
+    self.desplazamientos = desplazamientos
+    self.vecinos = vecinos
+    # Peso de cada arista, alineado con vecinos (None si todas pesan 1)
+    self.pesos = pesos
+    self.dirigido = dirigido
+
+  @classmethod
+  def desde_grafo(cls, grafo: _GrafoPonderado[T], dirigido: bool = False) -> "GrafoCSR[T]":
+    lista_nodos = list(grafo.nodos)
+    indices = {nodo: i for i, nodo in enumerate(lista_nodos)}
+    desplazamientos = array('l', [0])
+    vecinos = array('l')
+    pesos = array('d')
+    for nodo in lista_nodos:
+      fila = []
+      for vecino, peso in grafo.vecinos_con_peso(nodo):
+        if vecino not in indices:
+          # grafo_simple.Grafo admite aristas hacia nodos no agregados: pasan a la tabla al final
+          indices[vecino] = len(lista_nodos)
+          lista_nodos.append(vecino)
+        fila.append((indices[vecino], peso))
+      fila.sort()
+      vecinos.extend(j for j, _ in fila)
+      pesos.extend(peso for _, peso in fila)
+      desplazamientos.append(len(vecinos))
+    con_pesos = any(peso != 1 for peso in pesos)
+    return cls(lista_nodos, desplazamientos, vecinos, pesos if con_pesos else None, dirigido)
+
+  def guardar(self, ruta: str) -> None:
+    """Escribe el grafo en el formato binario que lee GrafoCSR.cargar()."""
+    etiquetas = pickle.dumps(self.lista_nodos, protocol=pickle.HIGHEST_PROTOCOL)
+    banderas = (
+      (_DIRIGIDO if self.dirigido else 0)
+      | (_CON_PESOS if self.pesos is not None else 0)
+      | (_BIG_ENDIAN if sys.byteorder == 'big' else 0)
+    )
+    with open(ruta, 'wb') as archivo:
+      archivo.write(_CABECERA.pack(
+        _MAGICO, _VERSION, array('l').itemsize, banderas, len(self), len(self.vecinos), len(etiquetas)
+      ))
+      archivo.write(self.desplazamientos)
+      archivo.write(self.vecinos)
+      if self.pesos is not None:
+        archivo.write(self.pesos)
+      archivo.write(etiquetas)
+
+  @classmethod
+  def cargar(cls, ruta: str) -> "GrafoCSR":
+    """Mapea en memoria un archivo escrito por guardar(), sin copiarlo.
+
+    Los arreglos son memoryview sobre el mapeo: la carga no depende del tamaño
+    del grafo y varios procesos que cargan el mismo archivo comparten sus páginas.
+    La tabla de nodos se lee recién cuando se consulta por nodo (no por id).
+    """
+    with open(ruta, 'rb') as archivo:
+      mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+    buffer = memoryview(mapa)
+    if len(buffer) < _CABECERA.size:
+      raise ValueError("El archivo no es un grafo CSR")
+    magico, version, tamano_entero, banderas, cantidad_nodos, cantidad_aristas, tamano_etiquetas = \
+      _CABECERA.unpack_from(buffer)
+    if magico != _MAGICO or version != _VERSION:
+      raise ValueError("El archivo no es un grafo CSR")
+    if tamano_entero != array('l').itemsize or bool(banderas & _BIG_ENDIAN) != (sys.byteorder == 'big'):
+      raise ValueError("El archivo fue escrito en una plataforma con otro formato de enteros")
+    tamano_pesos = cantidad_aristas * array('d').itemsize if banderas & _CON_PESOS else 0
+    # Límites de cada sección a partir de la cabecera
+    inicio_vecinos = _CABECERA.size + (cantidad_nodos + 1) * tamano_entero
+    inicio_pesos = inicio_vecinos + cantidad_aristas * tamano_entero
+    inicio_etiquetas = inicio_pesos + tamano_pesos
+    if len(buffer) != inicio_etiquetas + tamano_etiquetas:
+      raise ValueError("El archivo de grafo CSR está truncado o dañado")
+    grafo = cls(
+      None,
+      buffer[_CABECERA.size:inicio_vecinos].cast('l'),
+      buffer[inicio_vecinos:inicio_pesos].cast('l'),
+      buffer[inicio_pesos:inicio_etiquetas].cast('d') if banderas & _CON_PESOS else None,
+      bool(banderas & _DIRIGIDO),
+    )
+    grafo._etiquetas = buffer[inicio_etiquetas:]
+    grafo._mapa = mapa
+    grafo._ruta = ruta
+    return grafo
+
+  # Pickle: se guardan los arreglos como bytes y la tabla de nodos; el índice inverso se rearma al cargar
+  def __getstate__(self):
+    # Un grafo cargado de disco se serializa por copia de sus bytes, como uno en memoria
+    return (
+      self.lista_nodos,
+      self.desplazamientos.tobytes(),
+      self.vecinos.tobytes(),
+      None if self.pesos is None else self.pesos.tobytes(),
+      self.dirigido,
+    )
+
+  def __setstate__(self, estado) -> None:
+    lista_nodos, desplazamientos, vecinos, pesos, dirigido = estado
+    self.__init__(
+      lista_nodos,
+      array('l', desplazamientos),
+      array('l', vecinos),
+      None if pesos is None else array('d', pesos),
+      dirigido,
+    )
+
+  @property
+  def lista_nodos(self) -> list[T]:
+    if self._lista_nodos is None:
+      self._lista_nodos = pickle.loads(self._etiquetas)
+      self._etiquetas = None
+    return self._lista_nodos
+
+  @property
+  def indices(self) -> dict[T, int]:
+    if self._indices is None:
+      self._indices = {nodo: i for i, nodo in enumerate(self.lista_nodos)}
+    return self._indices
+
+  @property
+  def nodos(self):
+    return self.indices.keys()
+
+  def __len__(self) -> int:
+    return len(self.desplazamientos) - 1
+
+  def cantidad_aristas(self) -> int:
+    return len(self.vecinos)
+
+  def index_nodo(self, nodo: T) -> int:
+    if nodo not in self.indices:
+      raise ValueError("No existe el nodo en el grafo")
+    return self.indices[nodo]
+
+  # API por id: sin conversión a nodos, para los recorridos
+  def vecinos_id(self, i: int) -> Arreglo:
+    return self.vecinos[self.desplazamientos[i]:self.desplazamientos[i + 1]]
+
+  def grado_id(self, i: int) -> int:
+    return self.desplazamientos[i + 1] - self.desplazamientos[i]
+
+  # API por nodo, compatible con algoritmos_grafo.AdyacenciaPonderada
+  def vecinos_de(self, nodo: T) -> list[T]:
+    lista_nodos = self.lista_nodos
+    return [lista_nodos[j] for j in self.vecinos_id(self.index_nodo(nodo))]
+
+  def vecinos_con_peso(self, nodo: T) -> Iterator[tuple[T, float]]:
+    i = self.index_nodo(nodo)
+    desde, hasta = self.desplazamientos[i], self.desplazamientos[i + 1]
+    for k in range(desde, hasta):
+      yield self.lista_nodos[self.vecinos[k]], 1 if self.pesos is None else self.pesos[k]
+
+  def es_vecino_de(self, nodo: T, otro_nodo: T) -> bool:
+    # Búsqueda binaria en la fila ordenada: O(log grado)
+    i = self.index_nodo(nodo)
+    j = self.index_nodo(otro_nodo)
+    desde, hasta = self.desplazamientos[i], self.desplazamientos[i + 1]
+    k = bisect_left(self.vecinos, j, desde, hasta)
+    return k < hasta and self.vecinos[k] == j
+
+  def grado(self, nodo: T) -> int:
+    return self.grado_id(self.index_nodo(nodo))
+
+  def grados(self) -> dict[T, int]:
+    desplazamientos = self.desplazamientos
+    return dict(zip(self.lista_nodos, map(sub, desplazamientos[1:], desplazamientos)))
+
+  def bfs_id(self, origen: int) -> list[int]:
+    # Ids en orden BFS; visitados es un bytearray y la cola una lista que solo crece
+    desplazamientos = self.desplazamientos
+    vecinos = self.vecinos
+    visitados = bytearray(len(self))
+    visitados[origen] = 1
+    orden = [origen]
+    for i in orden:
+      for j in vecinos[desplazamientos[i]:desplazamientos[i + 1]]:
+        if not visitados[j]:
+          visitados[j] = 1
+          orden.append(j)
+    return orden
+
+  def bfs(self, origen: T) -> Iterator[T]:
+    lista_nodos = self.lista_nodos
+    return (lista_nodos[i] for i in self.bfs_id(self.index_nodo(origen)))
+
+  def distancias_id(self, origen: int) -> array:
+    """Distancia en aristas desde origen a cada id (-1 si no es alcanzable)."""
+    desplazamientos = self.desplazamientos
+    vecinos = self.vecinos
+    distancias = array('l', [-1]) * len(self)
+    distancias[origen] = 0
+    frontera = [origen]
+    for i in frontera:
+      siguiente = distancias[i] + 1
+      for j in vecinos[desplazamientos[i]:desplazamientos[i + 1]]:
+        if distancias[j] < 0:
+          distancias[j] = siguiente
+          frontera.append(j)
+    return distancias
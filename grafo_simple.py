@@ -1,5 +1,10 @@
 from funciones_grafico import grafico_grafo_simple
-from typing import Generic, TypeVar
+import time
+from collections.abc import Iterable, Iterator
+from typing import Any, Generic, Optional, TextIO, TypeVar
+import exportar
+from carga_aristas import ResumenCarga, lotes_de_aristas, nodos_faltantes
+from grafo_csr import GrafoCSR
 
 T = TypeVar('T')
 
@@ -25,22 +30,85 @@ class Grafo(Generic[T]):
     def __init__(self) -> None:
         self.nodos: set[Nodo[T]] = set()
         self.aristas: set[tuple[Nodo[T], Nodo[T]]] = set()
+        # Índice de incidencia: para cada nodo, los nodos con los que comparte una arista
+        self.adyacentes: dict[Nodo[T], set[Nodo[T]]] = {}
+        # Pesos de las aristas que no pesan 1, con la misma orientación que en aristas
+        self.pesos: dict[tuple[Nodo[T], Nodo[T]], float] = {}
         
     def agregar_nodo(self, nodo: Nodo[T]):
       if nodo in self.nodos:
         raise ValueError("El nodo ya se encuentra en el set.")
       self.nodos.add(nodo)
+      self.adyacentes.setdefault(nodo, set())
     
-    def agregar_arista(self, origen: T, destino: T) -> None:
+    def agregar_arista(self, origen: T, destino: T, peso: float = 1) -> None:
       if (origen, destino) in self.aristas or (destino, origen) in self.aristas:
         raise ValueError("La arista ya se encuentra en el set.")
       self.aristas.add((origen, destino))
+      if peso != 1:
+        self.pesos[(origen, destino)] = peso
+      self.adyacentes.setdefault(origen, set()).add(destino)
+      self.adyacentes.setdefault(destino, set()).add(origen)
+
+    def agregar_aristas(self, aristas: Iterable[tuple[Any, ...]], crear_nodos: bool = False) -> ResumenCarga:
+      """Carga masiva de aristas (origen, destino) u (origen, destino, peso) desde cualquier iterable.
+
+      Cada lote se valida junto antes de modificar el grafo: nodos existentes (o
+      creados si crear_nodos es True) y ninguna arista repetida, en ningún sentido,
+      ni contra el grafo ni dentro del lote. Si falla se lanza ValueError y el lote no se carga.
+      """
+      inicio = time.perf_counter()
+      total = creados = 0
+      for origenes, destinos, pesos in lotes_de_aristas(aristas):
+        faltantes = nodos_faltantes(self.nodos, origenes, destinos)
+        if faltantes and not crear_nodos:
+          raise ValueError("No existe en el grafo el nodo origen o destino de una arista")
+        nuevas = list(zip(origenes, destinos))
+        distintas = set(nuevas)
+        if (
+          len(distintas) != len(nuevas)
+          or not self.aristas.isdisjoint(distintas)
+          or any((destino, origen) in distintas or (destino, origen) in self.aristas
+                 for origen, destino in distintas if origen != destino)
+        ):
+          raise ValueError("La arista ya se encuentra en el set.")
+        for nodo in faltantes:
+          self.agregar_nodo(nodo)
+        creados += len(faltantes)
+        self.aristas.update(distintas)
+        adyacentes = self.adyacentes
+        for origen, destino in nuevas:
+          adyacentes[origen].add(destino)
+          adyacentes[destino].add(origen)
+        if pesos is not None:
+          for arista, peso in zip(nuevas, pesos):
+            if peso != 1:
+              self.pesos[arista] = peso
+        total += len(nuevas)
+      return ResumenCarga(total, creados, time.perf_counter() - inicio)
+
+    @classmethod
+    def desde_lista_aristas(
+      cls, aristas: Iterable[tuple[Any, ...]], nodos: Optional[Iterable[Nodo[T]]] = None
+    ) -> "Grafo[T]":
+      grafo: Grafo[T] = cls()
+      for nodo in nodos or ():
+        grafo.agregar_nodo(nodo)
+      grafo.agregar_aristas(aristas, crear_nodos=True)
+      return grafo
     
     def eliminar_nodo(self, nodo: T) -> None:
       if not nodo in self.nodos:
         raise ValueError("No existe el nodo a eliminar")
-      self.nodos = set(filter(lambda x: x.dato != nodo.dato, self.nodos))
-      self.aristas = set(filter(lambda arista: not nodo in arista, self.aristas))
+      # Solo se visitan las aristas del nodo: O(grado)
+      for vecino in self.adyacentes.pop(nodo, set()):
+        self.aristas.discard((nodo, vecino))
+        self.aristas.discard((vecino, nodo))
+        self.pesos.pop((nodo, vecino), None)
+        self.pesos.pop((vecino, nodo), None)
+        if vecino != nodo:
+          self.adyacentes[vecino].discard(nodo)
+      self.nodos.remove(nodo)
     
       
     def eliminar_arista(self, origen: T, destino: T) -> None:
@@ -48,19 +116,54 @@ class Grafo(Generic[T]):
       arista_eliminar_r = (destino, origen)
       if not (arista_eliminar in self.aristas or arista_eliminar_r in self.aristas):
           raise ValueError("No existe la arista a eliminar.")
-      self.aristas = set(filter(lambda arista: arista != arista_eliminar and arista != arista_eliminar_r, self.aristas))
+      self.aristas.discard(arista_eliminar)
+      self.aristas.discard(arista_eliminar_r)
+      self.pesos.pop(arista_eliminar, None)
+      self.pesos.pop(arista_eliminar_r, None)
+      self.adyacentes[origen].discard(destino)
+      self.adyacentes[destino].discard(origen)
 
       
     def es_vecino_de(self, nodo: T, otro_nodo: T) -> bool:
-      return (nodo, otro_nodo) in self.aristas or (otro_nodo, nodo) in self.aristas
+      return otro_nodo in self.adyacentes.get(nodo, ())
     
     def vecinos_de(self, nodo: T) -> set[T]:
-      return set(map(lambda arista: arista[0] if arista[0]!=nodo else arista[1],filter(lambda arista: nodo in arista, self.aristas)))
+      return set(self.adyacentes.get(nodo, ()))
+
+    def peso(self, origen: T, destino: T) -> float:
+      if not self.es_vecino_de(origen, destino):
+        raise ValueError("No existe la arista.")
+      return self.pesos.get((origen, destino), self.pesos.get((destino, origen), 1))
+
+    def vecinos_con_peso(self, nodo: T) -> Iterator[tuple[T, float]]:
+      pesos = self.pesos
+      return ((vecino, pesos.get((nodo, vecino), pesos.get((vecino, nodo), 1))) for vecino in self.adyacentes.get(nodo, ()))
+
+    def freeze(self) -> GrafoCSR[Nodo[T]]:
+      # Foto inmutable en formato CSR para consultas intensivas; no refleja cambios posteriores
+      return GrafoCSR.desde_grafo(self)
     
+    def iter_aristas(self) -> Iterator[tuple[Nodo[T], Nodo[T], float]]:
+      # (origen, destino, peso) de cada arista, con la orientación con la que se agregó
+      pesos = self.pesos
+      return ((origen, destino, pesos.get((origen, destino), 1)) for origen, destino in self.aristas)
+
+    # Exportación a un archivo de texto abierto (ver exportar): se escribe de a bloques, en O(V + E)
+    def escribir_dot(self, archivo: TextIO) -> None:
+      exportar.escribir_dot(archivo, self.nodos, self.iter_aristas())
+
+    def escribir_lista_aristas(self, archivo: TextIO) -> None:
+      exportar.escribir_lista_aristas(archivo, self.iter_aristas())
+
+    def escribir_lista_adyacencia(self, archivo: TextIO) -> None:
+      # adyacentes también tiene a los extremos de aristas que no se agregaron como nodos
+      exportar.escribir_lista_adyacencia(archivo, self.adyacentes.items())
+
     def ver_grafo(self):
       return f"nodos: {str(self.nodos)}\naristas: {str(self.aristas)}"
-    def mostrar(self):
-      grafico_grafo_simple(self.nodos, self.aristas)
+    def mostrar(self, archivo: Optional[str] = None):
+      # Con archivo (.png, .svg, ...) se guarda el dibujo en lugar de mostrarlo
+      grafico_grafo_simple(self.nodos, self.aristas, archivo)
     
 if __name__ == '__main__':
   gs = Grafo()
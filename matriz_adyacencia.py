@@ -1,23 +1,66 @@
-from typing import Generic, TypeVar
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from itertools import repeat
+from typing import Any, Generic, Optional, TextIO, TypeVar
+import exportar
+from almacen_matriz import AlmacenBits, AlmacenMatriz
+from carga_aristas import ResumenCarga, lotes_de_aristas, nodos_faltantes
+from grafo_csr import GrafoCSR
 from funciones_grafico import grafico_grafo
 T = TypeVar('T')
 
 class MatrizAdyacencia(Generic[T]):
-  def __init__(self) -> None:
-    self.matriz_adyacencia: list[list[int]] = []
-    self.nodos: set[T] = set()
+  def __init__(self, almacen: Optional[AlmacenMatriz] = None) -> None:
+    # Matriz de capacidad x capacidad: solo las primeras len(lista_nodos) filas/columnas están en uso.
+    # Por defecto se guarda con un bit por celda (ver almacen_matriz para las alternativas)
+    self.almacen: AlmacenMatriz = AlmacenBits() if almacen is None else almacen
+    # nodo -> fila/columna de la matriz, y la inversa fila/columna -> nodo
+    self.indices: dict[T, int] = {}
+    self.lista_nodos: list[T] = []
+    # Pesos de las aristas que no pesan 1, guardados en ambos sentidos (la matriz solo indica si hay arista)
+    self.pesos: dict[tuple[T, T], float] = {}
+
+  @property
+  def nodos(self):
+    # Vista de solo lectura de los nodos, en el orden de sus filas
+    return self.indices.keys()
   
   def index_nodo(self, nodo) -> int:
-    return list(self.nodos).index(nodo)
+    if nodo not in self.indices:
+      raise ValueError("No existe el nodo en la matriz")
+    return self.indices[nodo]
+
+  @property
+  def matriz_adyacencia(self) -> list[list[int]]:
+    # Copia densa de la parte en uso, como lista de listas de 0/1
+    return self.almacen.filas(len(self.lista_nodos))
+
+  def _reservar(self, cantidad: int) -> None:
+    # Agranda la matriz conservando las aristas; duplicar la capacidad amortiza el costo a O(n) por nodo
+    capacidad = self.almacen.capacidad()
+    if cantidad <= capacidad:
+      return
+    self.almacen.reservar(max(cantidad, 2 * capacidad))
 
   def agregar_nodo(self, nodo: T) -> None:
-    if nodo in self.nodos:
+    if nodo in self.indices:
       raise ValueError("Ya existe el nodo en la matriz")
-    self.nodos.add(nodo)
-    matriz = [ [0]*len(self.nodos) for _ in self.nodos]
-    self.matriz_adyacencia = matriz
+    self._reservar(len(self.lista_nodos) + 1)
+    self.indices[nodo] = len(self.lista_nodos)
+    self.lista_nodos.append(nodo)
+
+  def agregar_nodos(self, nodos: Iterable[T]) -> None:
+    nuevos = list(nodos)
+    if len(set(nuevos)) != len(nuevos) or any(nodo in self.indices for nodo in nuevos):
+      raise ValueError("Ya existe el nodo en la matriz")
+    # Se dimensiona la matriz una sola vez para todos los nodos
+    self._reservar(len(self.lista_nodos) + len(nuevos))
+    for nodo in nuevos:
+      self.indices[nodo] = len(self.lista_nodos)
+      self.lista_nodos.append(nodo)
     
-  def agregar_arista(self, origen: T, destino: T) -> None:
+  def agregar_arista(self, origen: T, destino: T, peso: float = 1) -> None:
     if not origen in self.nodos:
       raise ValueError("No existe el nodo origen en la matriz")
     if not destino in self.nodos:
@@ -25,8 +68,56 @@ class MatrizAdyacencia(Generic[T]):
      
     pos_o = self.index_nodo(origen)
     pos_d = self.index_nodo(destino)
-    self.matriz_adyacencia[pos_o][pos_d] = 1
-    self.matriz_adyacencia[pos_d][pos_o]= 1
+    self.almacen.poner(pos_o, pos_d, True)
+    self.almacen.poner(pos_d, pos_o, True)
+    self.pesos.pop((origen, destino), None)
+    self.pesos.pop((destino, origen), None)
+    if peso != 1:
+      self.pesos[(origen, destino)] = peso
+      self.pesos[(destino, origen)] = peso
+
+  def agregar_aristas(self, aristas: Iterable[tuple[Any, ...]], crear_nodos: bool = False) -> ResumenCarga:
+    """Carga masiva de aristas (origen, destino) u (origen, destino, peso) desde cualquier iterable.
+
+    Cada lote se valida junto, los nodos faltantes se agregan con un solo
+    agrandamiento de la matriz y las celdas se encienden con almacen.poner_lote.
+    Si falta un nodo y crear_nodos es False se lanza ValueError y el lote no se carga.
+    """
+    inicio = time.perf_counter()
+    total = creados = 0
+    for origenes, destinos, pesos in lotes_de_aristas(aristas):
+      faltantes = nodos_faltantes(self.indices, origenes, destinos)
+      if faltantes:
+        if not crear_nodos:
+          raise ValueError("No existe en la matriz el nodo origen o destino de una arista")
+        self.agregar_nodos(faltantes)
+        creados += len(faltantes)
+      indices = self.indices
+      filas = [indices[origen] for origen in origenes]
+      columnas = [indices[destino] for destino in destinos]
+      self.almacen.poner_lote(filas + columnas, columnas + filas)
+      if self.pesos or pesos is not None:
+        for origen, destino, peso in zip(origenes, destinos, repeat(1) if pesos is None else pesos):
+          self.pesos.pop((origen, destino), None)
+          self.pesos.pop((destino, origen), None)
+          if peso != 1:
+            self.pesos[(origen, destino)] = peso
+            self.pesos[(destino, origen)] = peso
+      total += len(origenes)
+    return ResumenCarga(total, creados, time.perf_counter() - inicio)
+
+  @classmethod
+  def desde_lista_aristas(
+    cls,
+    aristas: Iterable[tuple[Any, ...]],
+    nodos: Optional[Iterable[T]] = None,
+    almacen: Optional[AlmacenMatriz] = None
+  ) -> "MatrizAdyacencia[T]":
+    matriz: MatrizAdyacencia[T] = cls(almacen)
+    if nodos is not None:
+      matriz.agregar_nodos(nodos)
+    matriz.agregar_aristas(aristas, crear_nodos=True)
+    return matriz
   
   def eliminar_arista(self, origen: T, destino: T) -> None:
     if not origen in self.nodos:
@@ -36,17 +127,28 @@ class MatrizAdyacencia(Generic[T]):
     
     pos_o = self.index_nodo(origen)
     pos_d = self.index_nodo(destino)
-    self.matriz_adyacencia[pos_o][pos_d] = 0
-    self.matriz_adyacencia[pos_d][pos_o]= 0  
+    self.almacen.poner(pos_o, pos_d, False)
+    self.almacen.poner(pos_d, pos_o, False)
+    self.pesos.pop((origen, destino), None)
+    self.pesos.pop((destino, origen), None)
   def eliminar_nodo(self, nodo: T) -> None:
       if nodo not in self.nodos:
           raise ValueError("No existe el nodo en la matriz")
         
       pos_n = self.index_nodo(nodo)
-      self.nodos.remove(nodo)
-      self.matriz_adyacencia.pop(pos_n)
-      for fila in self.matriz_adyacencia:
-          fila.pop(pos_n)
+      if self.pesos:
+          for vecino in self.vecinos_de(nodo):
+              self.pesos.pop((nodo, vecino), None)
+              self.pesos.pop((vecino, nodo), None)
+      ultimo = len(self.lista_nodos) - 1
+      # El último nodo pasa a ocupar la fila/columna del eliminado y la última queda libre
+      self.almacen.quitar(pos_n, ultimo + 1)
+      if pos_n != ultimo:
+          nodo_ultimo = self.lista_nodos[ultimo]
+          self.lista_nodos[pos_n] = nodo_ultimo
+          self.indices[nodo_ultimo] = pos_n
+      del self.indices[nodo]
+      self.lista_nodos.pop()
 
   def es_vecino_de(self, nodo: T, otro_nodo: T) -> bool:
       if nodo not in self.nodos or otro_nodo not in self.nodos:
@@ -54,33 +156,79 @@ class MatrizAdyacencia(Generic[T]):
         
       pos_n = self.index_nodo(nodo)
       pos_otro = self.index_nodo(otro_nodo)
-      return self.matriz_adyacencia[pos_n][pos_otro] == 1
+      return self.almacen.hay(pos_n, pos_otro)
 
   def vecinos_de(self, nodo: T) -> set[T]:
     if nodo not in self.nodos:
       raise ValueError("El nodo no existe en la matriz")
         
     pos_n = self.index_nodo(nodo)
-    vecinos = set()
-    for idx, valor in enumerate(self.matriz_adyacencia[pos_n]):
-      if valor == 1:
-        vecinos.add(list(self.nodos)[idx])
-      return vecinos
+    return {self.lista_nodos[idx] for idx in self.almacen.vecinos(pos_n)}
+
+  def peso(self, origen: T, destino: T) -> float:
+    if not self.es_vecino_de(origen, destino):
+      raise ValueError("No existe una arista entre los nodos")
+    return self.pesos.get((origen, destino), 1)
+
+  def vecinos_con_peso(self, nodo: T) -> Iterator[tuple[T, float]]:
+    pesos = self.pesos
+    return ((vecino, pesos.get((nodo, vecino), 1)) for vecino in self.vecinos_de(nodo))
+
+  def freeze(self) -> GrafoCSR[T]:
+    return GrafoCSR.desde_grafo(self)
+
+  def grado(self, nodo: T) -> int:
+    return self.almacen.grado(self.index_nodo(nodo))
+
+  def grados(self) -> dict[T, int]:
+    return dict(zip(self.lista_nodos, self.almacen.grados(len(self.lista_nodos))))
+
+  def vecinos_comunes(self, nodo: T, otro_nodo: T) -> int:
+    return self.almacen.vecinos_comunes(self.index_nodo(nodo), self.index_nodo(otro_nodo))
+
+  def triangulos(self) -> int:
+    return self.almacen.triangulos(len(self.lista_nodos))
     
-  def mostrar_matriz(self):
-    print("   ", end='')
-    for nodo in self.nodos:
-      print(nodo, end=" ")
-    print()
-    max_longitud_fila = max(len(fila) for fila in self.matriz_adyacencia)
-    for i, fila in enumerate(self.matriz_adyacencia):
-      fila_str = str(list(self.nodos)[i]) + ": "
-      for elemento in fila:
-        fila_str += str(elemento) + " "
-      print(fila_str.ljust(max_longitud_fila*2))
-
-  def mostrar(self):
-    grafico_grafo(self.matriz_adyacencia, list(self.nodos))
+  def iter_aristas(self) -> Iterator[tuple[T, T, float]]:
+    # (origen, destino, peso) de cada arista una sola vez: la mitad superior de la matriz
+    lista_nodos = self.lista_nodos
+    pesos = self.pesos
+    for i, origen in enumerate(lista_nodos):
+      for j in self.almacen.vecinos(i):
+        if j >= i:
+          destino = lista_nodos[j]
+          yield origen, destino, pesos.get((origen, destino), 1)
+
+  # Exportación a un archivo de texto abierto (ver exportar): se escribe de a bloques, en O(V + E)
+  def escribir_dot(self, archivo: TextIO) -> None:
+    exportar.escribir_dot(archivo, self.lista_nodos, self.iter_aristas())
+
+  def escribir_lista_aristas(self, archivo: TextIO) -> None:
+    exportar.escribir_lista_aristas(archivo, self.iter_aristas())
+
+  def escribir_lista_adyacencia(self, archivo: TextIO) -> None:
+    lista_nodos = self.lista_nodos
+    exportar.escribir_lista_adyacencia(archivo, (
+      (nodo, (lista_nodos[j] for j in self.almacen.vecinos(i))) for i, nodo in enumerate(lista_nodos)
+    ))
+
+  def _lineas_matriz(self) -> Iterator[str]:
+    n = len(self.lista_nodos)
+    yield "   " + "".join(str(nodo) + " " for nodo in self.lista_nodos) + "\n"
+    # Cada fila se arma desde los vecinos del almacén, sin copiar la matriz entera
+    for i, nodo in enumerate(self.lista_nodos):
+      fila = ["0"] * n
+      for j in self.almacen.vecinos(i):
+        fila[j] = "1"
+      yield (str(nodo) + ": " + " ".join(fila) + " ").ljust(n * 2) + "\n"
+
+  def mostrar_matriz(self, archivo: Optional[TextIO] = None):
+    # Por defecto se imprime; con archivo (abierto en modo texto) se escribe ahí, de a bloques de filas
+    exportar.escribir_lineas(sys.stdout if archivo is None else archivo, self._lineas_matriz())
+
+  def mostrar(self, archivo: Optional[str] = None):
+    # Con archivo (.png, .svg, ...) se guarda el dibujo en lugar de mostrarlo
+    grafico_grafo(self.matriz_adyacencia, self.lista_nodos, archivo)
       
 if __name__ == '__main__':
   m = MatrizAdyacencia()
@@ -104,5 +252,7 @@ if __name__ == '__main__':
   m.eliminar_nodo(3)
   
   print("Vecinos de 2:", m.vecinos_de(2))
+  print("Grados:", m.grados())
+  print("Triángulos:", m.triangulos())
 
   m.mostrar()
\ No newline at end of file
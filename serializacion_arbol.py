@@ -0,0 +1,120 @@
+import pickle
+import struct
+import sys
+from array import array
+from collections.abc import Iterable, Iterator
+from itertools import chain, islice
+from typing import Any, BinaryIO, Optional
+
+# Formato binario de los árboles (ver ArbolBinario.guardar y ArbolBinarioOrdenado.guardar):
+#   cabecera: mágico, versión y tipo (FORMA o CLAVES)
+#   bloques: cantidad de nodos k, código de la columna de datos, bytes de la columna,
+#            [2 bits por nodo con sus hijos (solo FORMA)], columna de datos
+#   fin: un bloque con k = 0
+# FORMA guarda el preorden con la forma exacta; CLAVES guarda solo los datos en inorden.
+# Cada bloque se escribe y se lee entero, así que la memoria extra es la de un bloque.
+# Todo el archivo es little-endian, también las columnas de enteros y reales, que en una
+# plataforma big-endian se invierten al escribir y al leer.
+MAGICO = b'ARBL'
+VERSION = 1
+FORMA = 0
+CLAVES = 1
+NODOS_POR_BLOQUE = 65_536
+
+_CABECERA = struct.Struct('<4sBB')
+_BLOQUE = struct.Struct('<Icq')
+
+# Bits de hijos de un nodo: 1 = tiene izquierdo, 2 = tiene derecho
+IZQUIERDO = 1
+DERECHO = 2
+# Para cada byte, los bits de hijos de sus cuatro nodos
+_DESEMPAQUETAR = [tuple((byte >> corrimiento) & 3 for corrimiento in (0, 2, 4, 6)) for byte in range(256)]
+
+
+def _little_endian(arreglo: array) -> bytes:
+    if sys.byteorder == 'big':
+        arreglo.byteswap()
+    return arreglo.tobytes()
+
+
+def _desde_little_endian(tipo: str, contenido: bytes) -> array:
+    arreglo = array(tipo, contenido)
+    if sys.byteorder == 'big':
+        arreglo.byteswap()
+    return arreglo
+
+
+def _columna(datos: list[Any]) -> tuple[bytes, bytes]:
+    # Columna empaquetada: enteros de 64 bits, reales, textos UTF-8 o, si no, pickle
+    if all(type(dato) is int for dato in datos):
+        try:
+            return b'q', _little_endian(array('q', datos))
+        except OverflowError:
+            pass
+    elif all(type(dato) is float for dato in datos):
+        return b'd', _little_endian(array('d', datos))
+    elif all(type(dato) is str for dato in datos):
+        codificados = [dato.encode('utf-8') for dato in datos]
+        return b's', _little_endian(array('q', map(len, codificados))) + b''.join(codificados)
+    return b'p', pickle.dumps(datos, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _datos(codigo: bytes, contenido: bytes, cantidad: int) -> list[Any]:
+    if codigo == b'q' or codigo == b'd':
+        return _desde_little_endian(codigo.decode(), contenido).tolist()
+    if codigo == b's':
+        largos = _desde_little_endian('q', contenido[:8 * cantidad])
+        datos: list[Any] = []
+        inicio = 8 * cantidad
+        for largo in largos:
+            datos.append(contenido[inicio:inicio + largo].decode('utf-8'))
+            inicio += largo
+        return datos
+    if codigo == b'p':
+        return pickle.loads(contenido)
+    raise ValueError("Columna de datos desconocida en el archivo del árbol")
+
+
+def _leer(archivo: BinaryIO, cantidad: int) -> bytes:
+    contenido = archivo.read(cantidad)
+    if len(contenido) != cantidad:
+        raise ValueError("El archivo del árbol está truncado")
+    return contenido
+
+
+def escribir(archivo: BinaryIO, tipo: int, nodos: Iterable[tuple[Any, int]]) -> None:
+    """Escribe (dato, bits de hijos) en el orden dado; en CLAVES los bits se ignoran."""
+    archivo.write(_CABECERA.pack(MAGICO, VERSION, tipo))
+    iterador = iter(nodos)
+    while bloque := list(islice(iterador, NODOS_POR_BLOQUE)):
+        codigo, columna = _columna([dato for dato, _ in bloque])
+        archivo.write(_BLOQUE.pack(len(bloque), codigo, len(columna)))
+        if tipo == FORMA:
+            hijos = [bits for _, bits in bloque]
+            hijos.extend([0] * (-len(hijos) % 4))
+            archivo.write(bytes(a | b << 2 | c << 4 | d << 6 for a, b, c, d in zip(*[iter(hijos)] * 4)))
+        archivo.write(columna)
+    archivo.write(_BLOQUE.pack(0, b'-', 0))
+
+
+def leer(archivo: BinaryIO) -> tuple[int, Iterator[tuple[list[Any], Optional[Iterable[int]]]]]:
+    """Lee la cabecera y devuelve el tipo y un iterador que consume los bloques.
+
+    Cada bloque es (datos, bits de hijos de cada dato); en CLAVES los bits son None.
+    """
+    magico, version, tipo = _CABECERA.unpack(_leer(archivo, _CABECERA.size))
+    if magico != MAGICO or version != VERSION or tipo not in (FORMA, CLAVES):
+        raise ValueError("El archivo no es un árbol guardado con guardar()")
+
+    def bloques() -> Iterator[tuple[list[Any], Optional[Iterable[int]]]]:
+        while True:
+            cantidad, codigo, largo = _BLOQUE.unpack(_leer(archivo, _BLOQUE.size))
+            if cantidad == 0:
+                return
+            hijos = None
+            if tipo == FORMA:
+                empaquetados = _leer(archivo, (cantidad + 3) // 4)
+                hijos = chain.from_iterable(map(_DESEMPAQUETAR.__getitem__, empaquetados))
+            yield _datos(codigo, _leer(archivo, largo), cantidad), hijos
+
+    return tipo, bloques()